@@ -1,8 +1,17 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
-from app.services.token import refresh_token
+from app.core import metrics
+from app.core.decorator import json_result_wrapper
+from app.core.profiling import profile_store
+from app.db.base import engine, async_engine, async_replica_engines
+from app.db.pool import get_pool_status
+from app.db.session import get_db, get_async_read_db
+from app.dependencies.auth import get_token
+from app.schemas.user import UserType
+from app.services.token import refresh_token, get_user_from_token_async
 
 router = APIRouter()
 
@@ -13,3 +22,53 @@ router = APIRouter()
 def refresh_user_token(db: Session = Depends(get_db)):
     refresh_token(db)
     return { "state": "success" }
+
+
+# get connection pool status
+
+@router.get("/pool_status")
+@json_result_wrapper
+async def get_connection_pool_status(
+    db: AsyncSession = Depends(get_async_read_db),
+    token: str = Depends(get_token)
+):
+    user_info = await get_user_from_token_async(db, token)
+
+    if user_info.type != UserType.admin:
+        raise HTTPException(status_code=403, detail="관리자만 이용 가능한 기능입니다.")
+
+    return {
+        "sync": get_pool_status(engine),
+        # 비동기 엔진의 풀은 내부 동기 엔진이 관리한다
+        "async": get_pool_status(async_engine.sync_engine),
+        "replicas": [get_pool_status(replica.sync_engine) for replica in async_replica_engines],
+    }
+
+
+# get metrics (Prometheus text format)
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+# get request profile
+
+@router.get("/profiles/{profile_id}")
+@json_result_wrapper
+async def get_request_profile(
+    profile_id: str,
+    db: AsyncSession = Depends(get_async_read_db),
+    token: str = Depends(get_token)
+):
+    user_info = await get_user_from_token_async(db, token)
+
+    if user_info.type != UserType.admin:
+        raise HTTPException(status_code=403, detail="관리자만 이용 가능한 기능입니다.")
+
+    profile = profile_store.get(profile_id)
+
+    if not profile:
+        raise HTTPException(status_code=404, detail="프로파일 정보가 존재하지 않습니다.")
+
+    return profile
@@ -0,0 +1,90 @@
+from datetime import datetime, time
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.decorator import json_result_wrapper
+from app.db.session import get_async_read_db, get_async_write_db
+from app.dependencies.auth import get_token
+from app.schemas.capacity_calendar import CapacityCalendar, CapacityCalendarPutRequest, CapacityCalendarDeleteRequest
+from app.schemas.user import UserType
+from app.services.availability_broadcaster import availability_broadcaster
+from app.services.capacity_calendar import CapacityCalendarService
+from app.services.reservation import ReservationService
+from app.services.token import get_user_from_token_async
+
+router = APIRouter()
+
+
+async def check_admin(db: AsyncSession, token: str):
+    user_info = await get_user_from_token_async(db, token)
+
+    if user_info.type != UserType.admin:
+        raise HTTPException(status_code=403, detail="관리자만 이용 가능한 기능입니다.")
+
+
+@router.get("/capacity_calendar", response_model=List[CapacityCalendar])
+@json_result_wrapper
+async def get_capacity_calendar(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+    token: str = Depends(get_token)
+):
+    await check_admin(db, token)
+
+    try:
+        start_date = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else None
+        end_date = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="유효한 날짜 형식이 아닙니다. YYYY-MM-DD 형식의 날짜를 입력해주세요.")
+
+    return await CapacityCalendarService.get_calendar_async(db, start_date=start_date, end_date=end_date)
+
+
+@router.put("/capacity_calendar", response_model=CapacityCalendar)
+@json_result_wrapper
+async def set_capacity(
+    request: CapacityCalendarPutRequest,
+    db: AsyncSession = Depends(get_async_write_db),
+    token: str = Depends(get_token)
+):
+    await check_admin(db, token)
+
+    calendar = await CapacityCalendarService.set_capacity_async(
+        db,
+        target_date=request.target_date,
+        hour=request.hour,
+        capacity=request.capacity
+    )
+
+    day_start = datetime.combine(request.target_date, time())
+    ReservationService.invalidate_available_reservation_times((day_start, day_start))
+    availability_broadcaster.publish([request.target_date])
+
+    return calendar
+
+
+@router.delete("/capacity_calendar")
+async def delete_capacity(
+    request: CapacityCalendarDeleteRequest,
+    db: AsyncSession = Depends(get_async_write_db),
+    token: str = Depends(get_token)
+):
+    await check_admin(db, token)
+
+    try:
+        await CapacityCalendarService.delete_capacity_async(
+            db,
+            target_date=request.target_date,
+            hour=request.hour
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    day_start = datetime.combine(request.target_date, time())
+    ReservationService.invalidate_available_reservation_times((day_start, day_start))
+    availability_broadcaster.publish([request.target_date])
+
+    return { "state": "success" }
@@ -1,48 +1,198 @@
-from datetime import datetime, timedelta
-from typing import List, Dict, Union, Optional
+import asyncio
+import csv
+import io
+from datetime import date as date_type, datetime, timedelta
+from typing import List, Dict, Union, Optional, Literal
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.decorator import json_result_wrapper
-from app.db.session import get_db
+from app.core.etag import make_etag, get_not_modified_response, etag_result_response
+from app.core.serializer import RowEncoder, dumps
+from app.db.session import get_async_read_db, get_async_write_db, mark_recent_write, AsyncSessionLocal, AsyncReadSessionLocal
 from app.dependencies.auth import get_token
 from app.models.reservation import ReservationState
 from app.schemas.reservation import Reservation, ReservationPostRequest, ReservationGetResult, ReservationConfirmRequest, ReservationPutRequest, ReservationDeleteRequest
 from app.schemas.user import UserType
-from app.services.reservation import ReservationService
-from app.services.token import get_user_from_token
+from app.services.admission import admission_queue
+from app.services.availability_broadcaster import availability_broadcaster
+from app.services.data_version import DataVersionService
+from app.services.reservation import ReservationService, reservation_list_columns
+from app.services.token import get_user_from_token_async
 
 router = APIRouter()
 
+MAX_AVAILABLE_RANGE_DAYS = 31
+
+
+reservation_encoder = RowEncoder(reservation_list_columns)
+
+
+def get_available_etag(user_type: UserType, date_versions, user_versions) -> str:
+    # 날짜별 확정 인원/정원과 (고객인 경우) 본인 예약의 버전이 같으면 응답도 같다
+    return make_etag(
+        "available",
+        settings.RESERVATION_SLOT_MINUTES,
+        settings.MAX_APPLICANT_COUNT,
+        user_type.value,
+        sorted(date_versions.items()),
+        sorted(user_versions.items())
+    )
+
 
 @router.get("/reservations/available", response_model=List[Dict[str, Union[str, int]]])
 @json_result_wrapper
-def get_available_reservation_times(
+async def get_available_reservation_times(
+    http_request: Request,
     date: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     token: str = Depends(get_token)
 ):
-    user_info = get_user_from_token(db, token)
+    user_info = await get_user_from_token_async(db, token)
 
     try:
         target_date = datetime.strptime(date, "%Y-%m-%d")
     except ValueError:
         raise HTTPException(status_code=400, detail="유효한 날짜 형식이 아닙니다. YYYY-MM-DD 형식의 날짜를 입력해주세요.")
 
-    return ReservationService.get_available_reservation_times_for_date(db, user_info.idx, user_info.type, target_date)
+    date_versions, user_versions = await DataVersionService.get_versions_async(
+        db,
+        dates=[target_date.date()],
+        user_idx_list=[user_info.idx] if user_info.type == UserType.user else []
+    )
+    etag = get_available_etag(user_info.type, date_versions, user_versions)
+    not_modified_response = get_not_modified_response(http_request, etag)
+
+    if not_modified_response:
+        return not_modified_response
 
+    return etag_result_response(
+        await ReservationService.get_available_reservation_times_for_date_async(
+            db,
+            user_idx=user_info.idx,
+            user_type=user_info.type,
+            target_date=target_date,
+            date_versions=date_versions
+        ),
+        etag
+    )
 
-@router.get("/reservations", response_model=List[ReservationGetResult])
+
+@router.get("/reservations/available/range", response_model=List[Dict[str, Union[str, List[Dict[str, Union[str, int]]]]]])
 @json_result_wrapper
-def get_reservations(
+async def get_available_reservation_times_for_date_range(
+    http_request: Request,
+    start_date: str,
+    end_date: str,
+    db: AsyncSession = Depends(get_async_read_db),
+    token: str = Depends(get_token)
+):
+    user_info = await get_user_from_token_async(db, token)
+
+    try:
+        start_date = datetime.strptime(start_date, "%Y-%m-%d")
+        end_date = datetime.strptime(end_date, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="유효한 날짜 형식이 아닙니다. YYYY-MM-DD 형식의 날짜를 입력해주세요.")
+
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="종료 날짜는 시작 날짜보다 빠를 수 없습니다.")
+
+    if (end_date - start_date).days + 1 > MAX_AVAILABLE_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"최대 {MAX_AVAILABLE_RANGE_DAYS}일까지 조회할 수 있습니다.")
+
+    date_versions, user_versions = await DataVersionService.get_versions_async(
+        db,
+        dates=[start_date.date() + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)],
+        user_idx_list=[user_info.idx] if user_info.type == UserType.user else []
+    )
+    etag = get_available_etag(user_info.type, date_versions, user_versions)
+    not_modified_response = get_not_modified_response(http_request, etag)
+
+    if not_modified_response:
+        return not_modified_response
+
+    return etag_result_response(
+        await ReservationService.get_available_reservation_times_for_date_range_async(
+            db,
+            user_idx=user_info.idx,
+            user_type=user_info.type,
+            start_date=start_date,
+            end_date=end_date,
+            date_versions=date_versions
+        ),
+        etag
+    )
+
+
+def encode_availability_event(target_date: date_type, available_times: List[dict]) -> bytes:
+    return b"event: availability\ndata: " + dumps(dict(date=target_date, available_times=available_times)) + b"\n\n"
+
+
+async def stream_available_reservation_times(target_date: date_type):
+    # 응답이 시작되지 않으면 실행되지 않으므로, 구독 해제가 보장되도록 스트림 안에서 구독한다
+    queue = availability_broadcaster.subscribe(target_date)
+
+    try:
+        # 구독 등록 후 현재 상태를 보내므로 그 사이의 변경도 놓치지 않는다
+        async with AsyncSessionLocal() as db:
+            snapshot = await ReservationService.get_available_reservation_times_for_dates_async(db, dates=[target_date])
+
+        yield encode_availability_event(target_date, snapshot[target_date])
+
+        while True:
+            try:
+                available_times = await asyncio.wait_for(queue.get(), settings.SUBSCRIPTION_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+
+            if available_times is None:
+                return
+
+            yield encode_availability_event(target_date, available_times)
+    finally:
+        availability_broadcaster.unsubscribe(target_date, queue)
+
+
+@router.get("/reservations/available/subscribe")
+async def subscribe_available_reservation_times(
+    date: str,
+    db: AsyncSession = Depends(get_async_read_db),
+    token: str = Depends(get_token)
+):
+    await get_user_from_token_async(db, token)
+
+    try:
+        target_date = datetime.strptime(date, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="유효한 날짜 형식이 아닙니다. YYYY-MM-DD 형식의 날짜를 입력해주세요.")
+
+    if not availability_broadcaster.running:
+        raise HTTPException(status_code=503, detail="예약 가능 인원 구독을 사용할 수 없습니다.")
+
+    return StreamingResponse(
+        stream_available_reservation_times(target_date),
+        media_type="text/event-stream",
+        headers={ "Cache-Control": "no-cache", "X-Accel-Buffering": "no" }
+    )
+
+
+@router.get("/reservations",response_model=List[ReservationGetResult])
+@json_result_wrapper
+async def get_reservations(
+    http_request: Request,
     date: Optional[str] = None,
     size: Optional[int] = None,
     page: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
     token: str = Depends(get_token),
 ):
-    user_info = get_user_from_token(db, token)
+    user_info = await get_user_from_token_async(db, token)
 
     if date:
         try:
@@ -50,38 +200,125 @@ def get_reservations(
         except ValueError:
             raise HTTPException(status_code=400, detail="유효한 날짜 형식이 아닙니다. YYYY-MM-DD 형식의 날짜를 입력해주세요.")
 
-    if (size and not page) or (page and not size):
+    if page and not size:
         raise HTTPException(status_code=400, detail="size와 page는 함께 사용해야 합니다.")
 
-    reservations = ReservationService.get_reservations(
-        db=db,
-        user_idx=user_info.idx,
-        user_type=user_info.type,
-        date=date,
-        size=size,
-        page=page
+    if (size is not None and size < 1) or (page is not None and page < 1):
+        raise HTTPException(status_code=400, detail="size와 page는 1 이상이어야 합니다.")
+
+    if cursor and (not size or page):
+        raise HTTPException(status_code=400, detail="cursor는 size와 함께 사용해야 하며 page와 함께 사용할 수 없습니다.")
+
+    etag = None
+
+    # 고객의 목록은 본인 예약이 변경될 때만 달라진다 (관리자 목록은 전체 예약 대상이므로 제외)
+    if user_info.type == UserType.user:
+        _, user_versions = await DataVersionService.get_versions_async(db, user_idx_list=[user_info.idx])
+        etag = make_etag("reservations", user_info.idx, user_versions[user_info.idx], date, size, page, cursor)
+        not_modified_response = get_not_modified_response(http_request, etag)
+
+        if not_modified_response:
+            return not_modified_response
+
+    if size and not page:
+        try:
+            reservations, next_cursor = await ReservationService.get_reservations_by_cursor_async(
+                db,
+                user_idx=user_info.idx,
+                user_type=user_info.type,
+                size=size,
+                date=date,
+                cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        result = dict(
+            reservations=reservation_encoder.encode_all(reservations),
+            next_cursor=next_cursor
+        )
+    else:
+        result = reservation_encoder.encode_all(
+            await ReservationService.get_reservations_async(
+                db,
+                user_idx=user_info.idx,
+                user_type=user_info.type,
+                date=date,
+                size=size,
+                page=page
+            )
+        )
+
+    return etag_result_response(result, etag) if etag else result
+
+
+def encode_csv_rows(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+
+    return buffer.getvalue()
+
+
+async def stream_reservations(statement, export_format: str):
+    encoder = RowEncoder(statement.selected_columns)
+
+    # 요청 처리용 세션은 응답 전송 전에 닫히므로 스트리밍 전용 세션을 사용한다
+    async with AsyncReadSessionLocal() as db:
+        result = await db.stream(statement.execution_options(yield_per=1000))
+
+        if export_format == "csv":
+            yield encode_csv_rows([encoder.keys])
+
+        async for rows in result.partitions():
+            if export_format == "csv":
+                yield encode_csv_rows(encoder(row).values() for row in rows)
+            else:
+                yield b"".join(dumps(encoder(row)) + b"\n" for row in rows)
+
+
+@router.get("/reservations/export")
+async def export_reservations(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    state: Optional[ReservationState] = None,
+    user_idx: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+    token: str = Depends(get_token)
+):
+    user_info = await get_user_from_token_async(db, token)
+
+    if user_info.type != UserType.admin:
+        raise HTTPException(status_code=403, detail="관리자만 이용 가능한 기능입니다.")
+
+    try:
+        start_date = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+        end_date = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="유효한 날짜 형식이 아닙니다. YYYY-MM-DD 형식의 날짜를 입력해주세요.")
+
+    statement = ReservationService.get_reservations_export_statement(
+        start_date=start_date,
+        end_date=end_date,
+        state=state,
+        user_idx=user_idx
     )
 
-    return list(
-        ReservationGetResult(
-            idx=reservation.idx,
-            user_idx=reservation.user_idx,
-            start_time=reservation.start_time,
-            end_time=reservation.end_time,
-            applicant_count=reservation.applicant_count,
-            state=reservation.state.value,
-        ) for reservation in reservations
+    return StreamingResponse(
+        stream_reservations(statement, export_format),
+        media_type="text/csv" if export_format == "csv" else "application/x-ndjson",
+        headers={ "Content-Disposition": f"attachment; filename=reservations.{export_format}" }
     )
 
 
 @router.post("/reservations", response_model=Reservation)
 @json_result_wrapper
-def insert_reservation(
+async def insert_reservation(
     request: ReservationPostRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_write_db),
     token: str = Depends(get_token)
 ):
-    user_info = get_user_from_token(db, token)
+    user_info = await get_user_from_token_async(db, token)
 
     if user_info.type != UserType.user:
         raise HTTPException(status_code=403, detail="관리자는 예약할 수 없습니다.")
@@ -90,13 +327,24 @@ def insert_reservation(
         raise HTTPException(status_code=400, detail="예약은 시험 시작 3일 전까지 신청 가능합니다.")
 
     try:
-        new_reservation = ReservationService.insert_reservation(
-            db=db,
-            user_info=user_info,
-            start_time=request.start_time,
-            end_time=request.end_time,
-            applicant_count=request.applicant_count
-        )
+        if admission_queue.running:
+            # 동시에 들어온 신청과 함께 한 트랜잭션으로 처리
+            new_reservation = await admission_queue.submit(
+                user_info=user_info,
+                start_time=request.start_time,
+                end_time=request.end_time,
+                applicant_count=request.applicant_count
+            )
+            # 대기열의 세션은 요청과 무관하므로 요청 안에서 변경 시각을 기록한다
+            mark_recent_write(token)
+        else:
+            new_reservation = await ReservationService.insert_reservation_async(
+                db,
+                user_info=user_info,
+                start_time=request.start_time,
+                end_time=request.end_time,
+                applicant_count=request.applicant_count
+            )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -105,16 +353,16 @@ def insert_reservation(
 
 @router.put("/reservations/confirm", response_model=List[int])
 @json_result_wrapper
-def confirm_reservation(
+async def confirm_reservation(
     request: ReservationConfirmRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_write_db),
     token: str = Depends(get_token)
 ):
-    user_info = get_user_from_token(db, token)
+    user_info = await get_user_from_token_async(db, token)
 
     try:
-        value_error_list = ReservationService.confirm_reservation(
-            db=db,
+        value_error_list = await ReservationService.confirm_reservation_async(
+            db,
             reservation_idx_list=request.reservation_idx_list,
             user_type=user_info.type
         )
@@ -126,16 +374,16 @@ def confirm_reservation(
 
 @router.put("/reservations", response_model=Reservation)
 @json_result_wrapper
-def update_reservation(
+async def update_reservation(
     request: ReservationPutRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_write_db),
     token: str = Depends(get_token)
 ):
-    user_info = get_user_from_token(db, token)
+    user_info = await get_user_from_token_async(db, token)
 
     try:
-        updated_reservation = ReservationService.update_reservation(
-            db=db,
+        updated_reservation = await ReservationService.update_reservation_async(
+            db,
             reservation_idx=request.idx,
             user_idx=user_info.idx,
             user_type=user_info.type,
@@ -151,16 +399,16 @@ def update_reservation(
 
 
 @router.delete("/reservations")
-def delete_reservation(
+async def delete_reservation(
     request: ReservationDeleteRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_write_db),
     token: str = Depends(get_token)
 ):
-    user_info = get_user_from_token(db, token)
+    user_info = await get_user_from_token_async(db, token)
 
     try:
-        ReservationService.update_reservation(
-            db=db,
+        await ReservationService.update_reservation_async(
+            db,
             reservation_idx=request.idx,
             user_idx=user_info.idx,
             user_type=user_info.type,
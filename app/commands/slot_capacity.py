@@ -0,0 +1,32 @@
+import argparse
+import sys
+
+from app.db.session import SessionLocal
+from app.services.slot_capacity import SlotCapacityService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="slot_capacity 집계 테이블 검증 및 재계산")
+    parser.add_argument("action", choices=["verify", "rebuild"])
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.action == "rebuild":
+            drift = SlotCapacityService.rebuild(db)
+        else:
+            drift = SlotCapacityService.verify(db)
+    finally:
+        db.close()
+
+    for slot in drift:
+        print(f"{slot['slot_time']} ledger={slot['ledger_count']} expected={slot['expected_count']}")
+
+    print(f"{len(drift)} slot(s) drifted" + (" (rebuilt)" if args.action == "rebuild" else ""))
+
+    if drift and args.action == "verify":
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
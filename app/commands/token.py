@@ -0,0 +1,30 @@
+import argparse
+from datetime import datetime, timedelta
+
+from app.db.session import SessionLocal
+from app.services.token import extend_tokens, purge_expired_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description="토큰 만료 시간 일괄 연장 및 만료 토큰 삭제")
+    parser.add_argument("action", choices=["extend", "purge"])
+    parser.add_argument("--days", type=float, default=1, help="extend: 지금부터 연장할 일수, purge: 만료 후 보관할 일수")
+    parser.add_argument("--batch-size", type=int, help="한 트랜잭션에서 처리할 idx 범위 (기본값 TOKEN_BATCH_SIZE)")
+    args = parser.parse_args()
+
+    options = dict(batch_size=args.batch_size) if args.batch_size else {}
+
+    db = SessionLocal()
+    try:
+        if args.action == "extend":
+            count = extend_tokens(db, datetime.now() + timedelta(days=args.days), **options)
+        else:
+            count = purge_expired_tokens(db, datetime.now() - timedelta(days=args.days), **options)
+    finally:
+        db.close()
+
+    print(f"{count} token(s) " + ("extended" if args.action == "extend" else "purged"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None):
+        with self._lock:
+            item = self._items.get(key)
+
+            if item is None:
+                return default
+
+            value, expire_at = item
+
+            if expire_at <= time.monotonic():
+                del self._items[key]
+                return default
+
+            self._items.move_to_end(key)
+
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, generation: Optional[int] = None):
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            # 값을 조회하는 동안 무효화가 발생했다면 오래된 값이므로 저장하지 않는다
+            if generation is not None and generation != self.generation:
+                return
+
+            self._items[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, *keys: Hashable):
+        with self._lock:
+            self.generation += 1
+
+            for key in keys:
+                self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._items.clear()
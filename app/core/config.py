@@ -1,5 +1,6 @@
 from dotenv import load_dotenv
 import os
+import secrets
 
 load_dotenv()
 
@@ -13,6 +14,69 @@ class Settings:
         self.POSTGRES_PORT = os.getenv("POSTGRES_PORT")
 
         self.SQLALCHEMY_DATABASE_URI = f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        self.SQLALCHEMY_ASYNC_DATABASE_URI = f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+
+        # 읽기 전용 복제본 (host:port를 쉼표로 구분, 포트 생략 시 POSTGRES_PORT)
+        self.POSTGRES_REPLICA_HOSTS = [host.strip() for host in os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",") if host.strip()]
+        self.SQLALCHEMY_ASYNC_REPLICA_DATABASE_URIS = [
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{host if ':' in host else f'{host}:{self.POSTGRES_PORT}'}/{self.POSTGRES_DB}"
+            for host in self.POSTGRES_REPLICA_HOSTS
+        ]
+        self.REPLICA_STICKINESS_SECONDS = float(os.getenv("REPLICA_STICKINESS_SECONDS", 5))
+        self.REPLICA_STICKY_CACHE_SIZE = int(os.getenv("REPLICA_STICKY_CACHE_SIZE", 10000))
+        # 변경 시각을 클라이언트에 전달할 때 사용하는 서명 키 (모든 워커가 같아야 한다)
+        self.READ_AFTER_WRITE_SECRET = os.getenv("READ_AFTER_WRITE_SECRET", "")
+
+        if not self.READ_AFTER_WRITE_SECRET:
+            # 복제본이 없으면 모든 조회를 주 DB에서 처리하므로 워커마다 임의의 키를 사용해도 된다
+            if self.POSTGRES_REPLICA_HOSTS:
+                raise ValueError("POSTGRES_REPLICA_HOSTS를 사용하는 경우 READ_AFTER_WRITE_SECRET을 설정해야 합니다.")
+
+            self.READ_AFTER_WRITE_SECRET = secrets.token_hex(32)
+
+        self.DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+        self.DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+        self.DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+        self.DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+        self.DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+        self.DB_USE_NULL_POOL = os.getenv("DB_USE_NULL_POOL", "false").lower() == "true"
+        self.DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0))
+        self.DB_LOCK_TIMEOUT_MS = int(os.getenv("DB_LOCK_TIMEOUT_MS", 0))
+
+        self.SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+        self.PROFILE_STORE_SIZE = int(os.getenv("PROFILE_STORE_SIZE", 20))
+        self.PROFILE_STORE_TTL = float(os.getenv("PROFILE_STORE_TTL", 600))
+        self.PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", 0.001))
+
+        self.THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", 40))
+
+        # 동시에 들어온 예약 신청을 모아 한 트랜잭션으로 처리 (대기 시간(ms), 최대 건수, 0ms이면 사용하지 않음)
+        self.ADMISSION_BATCH_WINDOW_MS = float(os.getenv("ADMISSION_BATCH_WINDOW_MS", 5))
+        self.ADMISSION_BATCH_SIZE = int(os.getenv("ADMISSION_BATCH_SIZE", 100))
+
+        self.RESERVATION_SLOT_MINUTES = int(os.getenv("RESERVATION_SLOT_MINUTES", 60))
+        self.MAX_APPLICANT_COUNT = int(os.getenv("MAX_APPLICANT_COUNT", 50000))
+
+        self.AVAILABILITY_CACHE_SIZE = int(os.getenv("AVAILABILITY_CACHE_SIZE", 1024))
+        self.AVAILABILITY_CACHE_TTL = float(os.getenv("AVAILABILITY_CACHE_TTL", 30))
+        self.TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 10000))
+        self.TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL", 60))
+        self.CAPACITY_CALENDAR_CACHE_SIZE = int(os.getenv("CAPACITY_CALENDAR_CACHE_SIZE", 1024))
+        self.CAPACITY_CALENDAR_CACHE_TTL = float(os.getenv("CAPACITY_CALENDAR_CACHE_TTL", 300))
+
+        self.INTERVAL_INDEX_VALIDATE_INTERVAL = float(os.getenv("INTERVAL_INDEX_VALIDATE_INTERVAL", 60))
+
+        # 예약 가능 인원 구독(SSE) 연결 유지 메시지 주기(초), 구독자별 대기 메시지 수
+        self.SUBSCRIPTION_KEEPALIVE_INTERVAL = float(os.getenv("SUBSCRIPTION_KEEPALIVE_INTERVAL", 15))
+        self.SUBSCRIPTION_QUEUE_SIZE = int(os.getenv("SUBSCRIPTION_QUEUE_SIZE", 16))
+
+        # 워커 간 캐시 무효화 (LISTEN/NOTIFY 채널, 재연결 대기 시간(초), 연결 확인 주기(초))
+        self.INVALIDATION_CHANNEL = os.getenv("INVALIDATION_CHANNEL", "cache_invalidation")
+        self.INVALIDATION_RECONNECT_INTERVAL = float(os.getenv("INVALIDATION_RECONNECT_INTERVAL", 1))
+        self.INVALIDATION_PING_INTERVAL = float(os.getenv("INVALIDATION_PING_INTERVAL", 10))
+
+        # 토큰 만료 연장/삭제 시 한 트랜잭션에서 처리할 행 범위(idx 기준)
+        self.TOKEN_BATCH_SIZE = int(os.getenv("TOKEN_BATCH_SIZE", 10000))
 
 
 settings = Settings()
@@ -1,40 +1,24 @@
-from datetime import datetime
-from enum import Enum
+import inspect
 from functools import wraps
 
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi import Response
+from fastapi.concurrency import run_in_threadpool
 
-from app.db.base import Base, to_dict
-
-
-def convert_for_json(obj):
-    if isinstance(obj, Base):
-        return convert_for_json(to_dict(obj))
-
-    if isinstance(obj, BaseModel):
-        return convert_for_json(obj.model_dump())
-
-    if isinstance(obj, datetime):
-        return str(obj)
-
-    if isinstance(obj, Enum):
-        return obj.value
-
-    if isinstance(obj, dict):
-        return { key: convert_for_json(value) for key, value in obj.items() }
-
-    if isinstance(obj, list):
-        return [convert_for_json(item) for item in obj]
-
-    return obj
+from app.core.serializer import JSONResultResponse
 
 
 def json_result_wrapper(func):
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        result = func(*args, **kwargs)
+        if inspect.iscoroutinefunction(func):
+            result = await func(*args, **kwargs)
+        else:
+            result = await run_in_threadpool(func, *args, **kwargs)
+
+        # 304 응답이나 헤더를 직접 지정한 응답은 그대로 반환
+        if isinstance(result, Response):
+            return result
 
-        return JSONResponse(content={ "result": convert_for_json(result) })
+        return JSONResultResponse(content={ "result": result })
 
     return wrapper
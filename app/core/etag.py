@@ -0,0 +1,35 @@
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from app.core.serializer import JSONResultResponse
+
+
+def make_etag(*parts: Any) -> str:
+    return 'W/"' + hashlib.sha1(repr(parts).encode()).hexdigest() + '"'
+
+
+def normalize_etag(etag: str) -> str:
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두사를 무시한다
+    etag = etag.strip()
+
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def get_not_modified_response(request: Request, etag: str) -> Optional[Response]:
+    if_none_match = request.headers.get("If-None-Match")
+
+    if not if_none_match:
+        return None
+
+    tags = { normalize_etag(tag) for tag in if_none_match.split(",") }
+
+    if "*" in tags or normalize_etag(etag) in tags:
+        return Response(status_code=304, headers={ "ETag": etag })
+
+    return None
+
+
+def etag_result_response(result: Any, etag: str) -> JSONResultResponse:
+    return JSONResultResponse(content={ "result": result }, headers={ "ETag": etag })
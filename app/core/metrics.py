@@ -0,0 +1,175 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+default_latency_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+default_count_buckets = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+
+def escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(label_names: Sequence[str], label_values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    labels = list(zip(label_names, label_values)) + ([extra] if extra else [])
+
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{escape_label_value(value)}"' for name, value in labels) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{format_labels(self.label_names, label_values)} {value}")
+
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = default_latency_buckets):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+
+        # label_values -> [버킷별 개수, 합계, 개수]
+        self._values: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        bucket_index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            item = self._values.get(label_values)
+
+            if item is None:
+                item = self._values[label_values] = [[0] * len(self.buckets), 0.0, 0]
+
+            if bucket_index < len(self.buckets):
+                item[0][bucket_index] += 1
+
+            item[1] += value
+            item[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+
+        with self._lock:
+            for label_values, (bucket_counts, total, count) in sorted(self._values.items()):
+                cumulative_count = 0
+
+                for bucket, bucket_count in zip(self.buckets, bucket_counts):
+                    cumulative_count += bucket_count
+                    lines.append(f"{self.name}_bucket{format_labels(self.label_names, label_values, ('le', str(bucket)))} {cumulative_count}")
+
+                lines.append(f"{self.name}_bucket{format_labels(self.label_names, label_values, ('le', '+Inf'))} {count}")
+                lines.append(f"{self.name}_sum{format_labels(self.label_names, label_values)} {total}")
+                lines.append(f"{self.name}_count{format_labels(self.label_names, label_values)} {count}")
+
+        return lines
+
+
+class RequestDBStats:
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        # 프로파일링 중인 요청만 쿼리별 실행 기록을 남긴다
+        self.timeline: Optional[List[dict]] = None
+        self.timeline_start = 0.0
+
+
+# 요청 처리 중 실행된 쿼리 수와 DB 시간 (스레드풀, greenlet으로도 전파된다)
+request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds",
+    ("method", "route", "status"),
+)
+http_request_db_queries = Histogram(
+    "http_request_db_queries",
+    "Number of DB queries executed per HTTP request",
+    ("method", "route"),
+    buckets=default_count_buckets,
+)
+http_request_db_duration_seconds = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in DB queries per HTTP request in seconds",
+    ("method", "route"),
+)
+capacity_check_duration_seconds = Histogram(
+    "capacity_check_duration_seconds",
+    "Capacity check duration in ReservationService.validate_reservation in seconds",
+    ("source",),
+)
+reservation_admission_batch_size = Histogram(
+    "reservation_admission_batch_size",
+    "Number of reservation inserts committed together by the admission queue",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+db_slow_queries_total = Counter(
+    "db_slow_queries_total",
+    "Number of DB queries slower than SLOW_QUERY_THRESHOLD_MS",
+)
+
+registry = [
+    http_request_duration_seconds,
+    http_request_db_queries,
+    http_request_db_duration_seconds,
+    capacity_check_duration_seconds,
+    reservation_admission_batch_size,
+    db_slow_queries_total,
+]
+
+
+def record_query(statement: str, start: float, elapsed: float):
+    stats = request_db_stats.get()
+
+    if stats is not None:
+        stats.query_count += 1
+        stats.db_time += elapsed
+
+        if stats.timeline is not None:
+            stats.timeline.append(
+                dict(
+                    offset_ms=round((start - stats.timeline_start) * 1000, 3),
+                    duration_ms=round(elapsed * 1000, 3),
+                    statement=statement,
+                )
+            )
+
+
+class Timer:
+    def __init__(self, histogram: Histogram, *label_values: str):
+        self.histogram = histogram
+        self.label_values = label_values
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, *self.label_values)
+
+
+def render() -> str:
+    return "\n".join(line for metric in registry for line in metric.render()) + "\n"
@@ -0,0 +1,59 @@
+import time
+import uuid
+
+from fastapi import Request
+from pyinstrument import Profiler
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import RequestDBStats
+
+profile_store = TTLCache(settings.PROFILE_STORE_SIZE, settings.PROFILE_STORE_TTL)
+
+
+def is_profile_requested(request: Request) -> bool:
+    return (
+        request.headers.get("X-Profile", "").lower() in ("1", "true")
+        or request.query_params.get("profile", "").lower() in ("1", "true")
+    )
+
+
+class RequestProfiler:
+    def __init__(self, request: Request, stats: RequestDBStats):
+        self.request = request
+        self.stats = stats
+        # 현재 요청의 컨텍스트에서 실행된 코드만 기록하므로 동시에 처리 중인 다른 요청과 섞이지 않는다
+        self.profiler = Profiler(interval=settings.PROFILE_INTERVAL, async_mode="strict")
+
+    def __enter__(self):
+        self.stats.timeline = []
+        self.start = time.perf_counter()
+        self.stats.timeline_start = self.start
+        self.profiler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.stop()
+        self.duration = time.perf_counter() - self.start
+
+    def save(self, status_code: int) -> str:
+        profile_id = uuid.uuid4().hex
+        profile_store.set(
+            profile_id,
+            dict(
+                profile_id=profile_id,
+                method=self.request.method,
+                path=self.request.url.path,
+                query=str(self.request.query_params),
+                status_code=status_code,
+                duration_ms=round(self.duration * 1000, 3),
+                sql=dict(
+                    query_count=self.stats.query_count,
+                    total_ms=round(self.stats.db_time * 1000, 3),
+                    timeline=self.stats.timeline,
+                ),
+                profile=self.profiler.output_text(),
+            )
+        )
+
+        return profile_id
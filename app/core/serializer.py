@@ -0,0 +1,68 @@
+from datetime import date, datetime
+from enum import Enum as PythonEnum
+from typing import Any, Iterable, List
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import DateTime, Enum
+
+from app.db.base import Base, to_dict
+
+
+def get_value_converter(column_type):
+    if isinstance(column_type, DateTime):
+        return str
+
+    if isinstance(column_type, Enum):
+        return lambda value: value.value if isinstance(value, PythonEnum) else value
+
+    return None
+
+
+class RowEncoder:
+    def __init__(self, columns: Iterable):
+        columns = list(columns)
+
+        self.keys = tuple(column.key for column in columns)
+        self.converters = tuple(
+            (column.key, converter)
+            for column in columns
+            if (converter := get_value_converter(column.type)) is not None
+        )
+
+    def __call__(self, row) -> dict:
+        item = dict(zip(self.keys, row))
+
+        for key, converter in self.converters:
+            value = item[key]
+
+            if value is not None:
+                item[key] = converter(value)
+
+        return item
+
+    def encode_all(self, rows: Iterable) -> List[dict]:
+        return [self(row) for row in rows]
+
+
+def json_default(obj: Any):
+    if isinstance(obj, (date, datetime)):
+        return str(obj)
+
+    if isinstance(obj, Base):
+        return to_dict(obj)
+
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=json_default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+
+
+class JSONResultResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
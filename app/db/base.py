@@ -1,12 +1,94 @@
+import logging
+import time
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from uuid import uuid4
 
-from sqlalchemy import create_engine, Column, DateTime, Integer
+from sqlalchemy import create_engine, event, Column, DateTime, Integer
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.declarative import as_declarative
 from sqlalchemy.inspection import inspect
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.core.metrics import db_slow_queries_total, record_query
+from app.db.pool import MeteredQueuePool, MeteredAsyncAdaptedQueuePool
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+logger = logging.getLogger(__name__)
+
+
+def get_server_settings():
+    server_settings = {}
+
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+
+    if settings.DB_LOCK_TIMEOUT_MS:
+        server_settings["lock_timeout"] = str(settings.DB_LOCK_TIMEOUT_MS)
+
+    return server_settings
+
+
+def get_engine_options(is_async: bool = False):
+    if settings.DB_USE_NULL_POOL:
+        # PgBouncer(transaction pooling) 등 외부 풀러 사용 시 연결을 보관하지 않는다
+        # 풀러는 연결 시작 옵션을 전달하지 않으므로 timeout은 DB 역할(ALTER ROLE ... SET)에 설정해야 한다
+        return dict(
+            poolclass=NullPool,
+            # 트랜잭션마다 서버 연결이 바뀔 수 있으므로 prepared statement를 캐시하지 않고,
+            # 다른 클라이언트가 같은 서버 연결에 만든 prepared statement와 이름이 겹치지 않도록 고유한 이름을 사용한다
+            connect_args=dict(
+                statement_cache_size=0,
+                prepared_statement_cache_size=0,
+                prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+            ) if is_async else {},
+        )
+
+    server_settings = get_server_settings()
+
+    if is_async:
+        connect_args = dict(server_settings=server_settings) if server_settings else {}
+    else:
+        connect_args = dict(options=" ".join(f"-c {key}={value}" for key, value in server_settings.items())) if server_settings else {}
+
+    return dict(
+        poolclass=MeteredAsyncAdaptedQueuePool if is_async else MeteredQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, **get_engine_options())
+async_engine = create_async_engine(settings.SQLALCHEMY_ASYNC_DATABASE_URI, **get_engine_options(is_async=True))
+async_replica_engines = [
+    create_async_engine(uri, **get_engine_options(is_async=True))
+    for uri in settings.SQLALCHEMY_ASYNC_REPLICA_DATABASE_URIS
+]
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.query_start_time = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context.query_start_time
+
+    record_query(statement, context.query_start_time, elapsed)
+
+    if elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+        db_slow_queries_total.inc()
+        logger.warning("느린 쿼리 (%.1fms): %s", elapsed * 1000, statement)
+
+
+# 비동기 엔진의 쿼리도 내부 동기 엔진에서 실행된다
+for query_engine in (engine, async_engine.sync_engine, *(replica.sync_engine for replica in async_replica_engines)):
+    event.listen(query_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(query_engine, "after_cursor_execute", after_cursor_execute)
 
 
 @as_declarative()
@@ -17,5 +99,14 @@ class Base:
     __name__: str
 
 
+@lru_cache(maxsize=None)
+def get_column_getter(model):
+    keys = tuple(c.key for c in inspect(model).column_attrs)
+
+    return keys, attrgetter(*keys)
+
+
 def to_dict(obj):
-    return { c.key: getattr(obj, c.key) for c in inspect(obj).mapper.column_attrs }
+    keys, getter = get_column_getter(type(obj))
+
+    return dict(zip(keys, getter(obj)))
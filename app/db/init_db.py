@@ -1,13 +1,115 @@
+import logging
+
+from sqlalchemy import inspect, text
+
+from app.core.config import settings
 from app.db.base import engine, Base
 from app.db.session import SessionLocal
-from app.services.token import refresh_token
+from app.models.capacity_calendar import CapacityCalendar
+from app.models.token import TokenInfo
+from app.services.slot_capacity import SlotCapacityService
+from app.services.token import refresh_token, get_idx_ranges
+
+logger = logging.getLogger(__name__)
+
+
+# 모델에서 제거된 인덱스
+obsolete_indexes = [
+    "idx_reservation_time",
+    "idx_token_info_token",
+    "idx_reservation_confirmed_time",
+    "idx_capacity_calendar_date_hour",
+]
+
+
+def migrate_token_hash():
+    # 토큰 원문 컬럼(token)을 SHA-256 해시 컬럼(token_hash)으로 옮긴다
+    columns = {column["name"] for column in inspect(engine).get_columns(TokenInfo.__tablename__)}
+
+    if "token" not in columns:
+        return
+
+    session = SessionLocal()
+    try:
+        # 여러 워커가 동시에 시작해도 한 프로세스만 옮기도록 잠그고, 한 트랜잭션으로 처리한다
+        session.execute(text(f"LOCK TABLE {TokenInfo.__tablename__} IN ACCESS EXCLUSIVE MODE"))
+
+        # 잠금을 기다리는 동안 다른 프로세스가 먼저 옮겼을 수 있다
+        columns = {column["name"] for column in inspect(session.connection()).get_columns(TokenInfo.__tablename__)}
+
+        if "token" not in columns:
+            session.rollback()
+            return
+
+        session.execute(text(f"ALTER TABLE {TokenInfo.__tablename__} ADD COLUMN IF NOT EXISTS token_hash VARCHAR(64)"))
+
+        for start_idx, end_idx in get_idx_ranges(session, settings.TOKEN_BATCH_SIZE):
+            session.execute(
+                text(
+                    f"UPDATE {TokenInfo.__tablename__} SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex') "
+                    "WHERE idx >= :start_idx AND idx < :end_idx AND token_hash IS NULL"
+                ),
+                dict(start_idx=start_idx, end_idx=end_idx)
+            )
+
+        # 중복된 토큰이 있으면 고유 인덱스를 만들 수 없으므로 원문 컬럼을 유지한 채 중단한다
+        duplicates = session.execute(
+            text(
+                f"SELECT array_agg(idx ORDER BY idx) AS idx_list FROM {TokenInfo.__tablename__} "
+                "GROUP BY token_hash HAVING count(*) > 1 ORDER BY min(idx)"
+            )
+        ).scalars().all()
+
+        if duplicates:
+            raise RuntimeError(
+                f"token_info에 중복된 토큰이 {len(duplicates)}종 있습니다. 중복을 정리한 뒤 다시 시작해주세요. (idx: {duplicates[:10]})"
+            )
+
+        session.execute(text(f"ALTER TABLE {TokenInfo.__tablename__} ALTER COLUMN token_hash SET NOT NULL"))
+        session.execute(text(f"ALTER TABLE {TokenInfo.__tablename__} DROP COLUMN token"))
+        session.commit()
+    finally:
+        session.close()
+
+
+def dedupe_capacity_calendar():
+    # 이전 인덱스는 hour가 NULL인 행의 중복을 막지 못했으므로 고유 인덱스를 만들기 전에 최신 행만 남긴다
+    with engine.begin() as connection:
+        result = connection.execute(text(
+            f"DELETE FROM {CapacityCalendar.__tablename__} a USING {CapacityCalendar.__tablename__} b "
+            "WHERE a.target_date = b.target_date AND a.hour IS NOT DISTINCT FROM b.hour AND a.idx < b.idx"
+        ))
+
+    if result.rowcount:
+        logger.warning("capacity_calendar의 중복 정원 %d건을 삭제했습니다.", result.rowcount)
+
+
+def sync_indexes():
+    with engine.begin() as connection:
+        for index_name in obsolete_indexes:
+            connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+    # create_all은 이미 존재하는 테이블에 추가된 인덱스를 생성하지 않는다
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    migrate_token_hash()
+    dedupe_capacity_calendar()
+    sync_indexes()
 
     session = SessionLocal()
     try:
         refresh_token(session)
+
+        # 집계가 없거나 다른 집계 단위(RESERVATION_SLOT_MINUTES)로 만들어진 경우 다시 계산한다
+        if SlotCapacityService.is_stale(session):
+            drift = SlotCapacityService.rebuild(session, only_if_stale=True)
+
+            if drift:
+                logger.warning("slot_capacity 집계를 다시 계산했습니다. (%d개 시간대 변경)", len(drift))
     finally:
         session.close()
@@ -0,0 +1,79 @@
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from app.core.config import settings
+
+
+class PoolStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def record(self, wait_time: float, timed_out: bool = False):
+        with self.lock:
+            self.checkouts += 1
+            self.timeouts += timed_out
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def to_dict(self):
+        with self.lock:
+            return dict(
+                checkouts=self.checkouts,
+                timeouts=self.timeouts,
+                total_wait_ms=round(self.total_wait_time * 1000, 3),
+                avg_wait_ms=round(self.total_wait_time * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                max_wait_ms=round(self.max_wait_time * 1000, 3),
+            )
+
+
+class MeteredPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        # 풀에서 연결을 얻기까지 걸린 시간 (대기, 신규 연결, pre-ping 포함)
+        start = time.perf_counter()
+
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+
+        self.stats.record(time.perf_counter() - start)
+
+        return connection
+
+
+class MeteredQueuePool(MeteredPoolMixin, QueuePool):
+    pass
+
+
+class MeteredAsyncAdaptedQueuePool(MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def get_pool_status(engine: Engine):
+    pool = engine.pool
+
+    if isinstance(pool, NullPool):
+        return dict(pool_class=type(pool).__name__)
+
+    return dict(
+        pool_class=type(pool).__name__,
+        size=pool.size(),
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        **(pool.stats.to_dict() if isinstance(pool, MeteredPoolMixin) else {}),
+    )
@@ -1,8 +1,99 @@
-from sqlalchemy.orm import sessionmaker
+import hashlib
+import hmac
+import random
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import Insert, Update, Delete
+from sqlalchemy import event
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.base import engine, async_engine, async_replica_engines
+from app.dependencies.auth import get_token
+
+READ_AFTER_WRITE_COOKIE = "read_after_write"
+READ_AFTER_WRITE_HEADER = "X-Read-After-Write"
+
+# 최근에 변경 요청을 보낸 토큰 (일정 시간 동안 조회도 주 DB에서 처리)
+recent_writers = TTLCache(max_size=settings.REPLICA_STICKY_CACHE_SIZE, ttl=settings.REPLICA_STICKINESS_SECONDS)
+last_write_at = float("-inf")
+# 요청 처리 중 변경을 커밋한 토큰과 시각 (미들웨어가 응답 쿠키/헤더로 전달)
+request_write_state: ContextVar[Optional[dict]] = ContextVar("request_write_state", default=None)
+
+
+class ReplicaRoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not async_replica_engines or self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            return async_engine.sync_engine
+
+        # 요청 안에서는 같은 복제본을 사용하여 조회 결과가 뒤섞이지 않도록 한다
+        if "replica" not in self.info:
+            self.info["replica"] = random.choice(async_replica_engines).sync_engine
+
+        return self.info["replica"]
 
-from app.db.base import engine
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=async_engine)
+AsyncReadSessionLocal = async_sessionmaker(autocommit=False, autoflush=False, sync_session_class=ReplicaRoutingSession)
+
+
+def mark_recent_write(token: str):
+    global last_write_at
+
+    recent_writers.set(token, True)
+    last_write_at = time.monotonic()
+
+    state = request_write_state.get()
+
+    if state is not None:
+        state.update(token=token, written_at=time.time())
+
+
+def sign_write_time(token: str, written_at: float) -> str:
+    value = f"{written_at:.3f}"
+    signature = hmac.new(settings.READ_AFTER_WRITE_SECRET.encode(), f"{token}:{value}".encode(), hashlib.sha256).hexdigest()
+
+    return f"{value}.{signature[:32]}"
+
+
+def is_recent_writer(request: Request, token: str) -> bool:
+    if recent_writers.get(token):
+        return True
+
+    # 다른 워커에서 처리된 변경은 클라이언트가 돌려보낸 변경 시각으로 판단한다
+    signed_value = request.headers.get(READ_AFTER_WRITE_HEADER) or request.cookies.get(READ_AFTER_WRITE_COOKIE)
+
+    if not signed_value:
+        return False
+
+    value, _, _ = signed_value.rpartition(".")
+
+    try:
+        written_at = float(value)
+    except ValueError:
+        return False
+
+    return (
+        hmac.compare_digest(signed_value, sign_write_time(token, written_at))
+        and time.time() - written_at < settings.REPLICA_STICKINESS_SECONDS
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def mark_session_write(session: Session):
+    if session.info.get("writer"):
+        mark_recent_write(session.info["writer"])
+
+
+def is_cacheable_read(db: Session) -> bool:
+    # 변경 직후 복제본에서 읽은 값은 복제 지연으로 변경 내용이 빠져 있을 수 있으므로 공용 캐시에 저장하지 않는다
+    return "replica" not in db.info or time.monotonic() - last_write_at >= settings.REPLICA_STICKINESS_SECONDS
 
 
 def get_db():
@@ -13,3 +104,16 @@ def get_db():
 
     finally:
         db.close()
+
+
+async def get_async_read_db(request: Request, token: str = Depends(get_token)):
+    # 변경 직후에는 데이터와 ETag 버전을 모두 주 DB에서 읽는다
+    session_class = AsyncSessionLocal if is_recent_writer(request, token) else AsyncReadSessionLocal
+
+    async with session_class() as db:
+        yield db
+
+
+async def get_async_write_db(token: str = Depends(get_token)):
+    async with AsyncSessionLocal(info={ "writer": token }) as db:
+        yield db
@@ -1,7 +1,7 @@
 from fastapi import Request, HTTPException
 
 
-def get_token(request: Request) -> str:
+async def get_token(request: Request) -> str:
     auth_header = request.headers.get("Authorization")
 
     if not auth_header or not auth_header.startswith("Bearer "):
@@ -1,34 +1,198 @@
+import asyncio
+import logging
+import math
+import time
 from contextlib import asynccontextmanager
+from datetime import date
 
-from fastapi import FastAPI
+from anyio import to_thread
+from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.endpoints import reservation, base
+from app.api.endpoints import reservation, base, capacity_calendar
+from app.core.config import settings
+from app.core.metrics import RequestDBStats, request_db_stats, http_request_duration_seconds, http_request_db_queries, http_request_db_duration_seconds
+from app.core.profiling import RequestProfiler, is_profile_requested
+from app.db.base import engine, async_engine
 from app.db.init_db import init_db
+from app.db.session import SessionLocal, AsyncSessionLocal, request_write_state, sign_write_time, READ_AFTER_WRITE_COOKIE, READ_AFTER_WRITE_HEADER
+from app.dependencies.auth import get_token
+from app.schemas.user import UserType
+from app.services.admission import admission_queue
+from app.services.availability_broadcaster import availability_broadcaster
+from app.services.capacity_calendar import capacity_calendar_cache
+from app.services.interval_index import confirmed_interval_index
+from app.services.invalidation_bus import invalidation_bus
+from app.services.reservation import ReservationService, available_reservation_times_cache
+from app.services.token import get_user_from_token_async, token_cache
+
+logger = logging.getLogger(__name__)
+
+
+def validate_interval_index():
+    session = SessionLocal()
+    try:
+        confirmed_interval_index.validate(session)
+    finally:
+        session.close()
+
+
+async def run_interval_index_validation():
+    while True:
+        await asyncio.sleep(settings.INTERVAL_INDEX_VALIDATE_INTERVAL)
+
+        try:
+            await to_thread.run_sync(validate_interval_index)
+        except Exception:
+            logger.exception("확정 예약 인덱스 검증에 실패했습니다.")
+
+
+async def fetch_available_reservation_times(dates):
+    # 복제 지연 없이 커밋된 변경을 전달하도록 기본 DB에서 조회
+    async with AsyncSessionLocal() as db:
+        return await ReservationService.get_available_reservation_times_for_dates_async(db, dates=dates)
+
+
+def refresh_interval_index(idx_list):
+    session = SessionLocal()
+    try:
+        confirmed_interval_index.refresh(session, idx_list)
+    finally:
+        session.close()
+
+
+async def apply_invalidation(message: dict):
+    # 다른 워커(프로세스)에서 커밋된 변경을 캐시와 확정 예약 인덱스에 반영
+    if message["tokens"]:
+        token_cache.clear()
+
+    if message["dates"] is None:
+        available_reservation_times_cache.clear()
+        capacity_calendar_cache.clear()
+        availability_broadcaster.publish(list(availability_broadcaster.subscribers))
+    elif message["dates"]:
+        dates = [date.fromisoformat(target_date) for target_date in message["dates"]]
+        available_reservation_times_cache.delete(*dates)
+        capacity_calendar_cache.delete(*dates)
+        availability_broadcaster.publish(dates)
+
+    if message["reservations"] is None:
+        await to_thread.run_sync(validate_interval_index)
+    elif message["reservations"]:
+        await to_thread.run_sync(refresh_interval_index, message["reservations"])
 
 
 def startup():
     init_db()
+    validate_interval_index()
 
 
 def shutdown():
-    pass
+    engine.dispose()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 동기 엔드포인트/의존성이 사용하는 스레드풀 크기 제한
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
     startup()
+    interval_index_validation = asyncio.create_task(run_interval_index_validation())
+
+    if settings.ADMISSION_BATCH_WINDOW_MS > 0:
+        admission_queue.start()
+
+    availability_broadcaster.start(fetch_available_reservation_times)
+    invalidation_bus.start(apply_invalidation)
 
     yield
 
+    await invalidation_bus.stop()
+    await availability_broadcaster.stop()
+    await admission_queue.stop()
+    interval_index_validation.cancel()
     shutdown()
+    await async_engine.dispose()
 
 
 app = FastAPI(lifespan=lifespan)
 
 # middleware
-app.add_middleware(CORSMiddleware, allow_origins=["*"])
+app.add_middleware(CORSMiddleware, allow_origins=["*"], expose_headers=["ETag", READ_AFTER_WRITE_HEADER])
+
+
+async def is_profile_allowed(request: Request) -> bool:
+    # 관리자가 아닌 경우 프로파일링 요청은 무시하고 평소대로 처리한다
+    try:
+        token = await get_token(request)
+
+        async with AsyncSessionLocal() as db:
+            user_info = await get_user_from_token_async(db, token)
+    except HTTPException:
+        return False
+
+    return user_info.type == UserType.admin
+
+
+@app.middleware("http")
+async def attach_read_after_write(request: Request, call_next):
+    # 변경을 커밋한 요청은 서명된 변경 시각을 돌려주어, 다른 워커에서도 이후 조회를 주 DB에서 처리하도록 한다
+    state = {}
+    state_token = request_write_state.set(state)
+
+    try:
+        response = await call_next(request)
+    finally:
+        request_write_state.reset(state_token)
+
+    if state:
+        signed_value = sign_write_time(state["token"], state["written_at"])
+        response.headers[READ_AFTER_WRITE_HEADER] = signed_value
+        response.set_cookie(
+            READ_AFTER_WRITE_COOKIE,
+            signed_value,
+            max_age=math.ceil(settings.REPLICA_STICKINESS_SECONDS),
+            httponly=True,
+            samesite="lax"
+        )
+
+    return response
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    profiling = is_profile_requested(request) and await is_profile_allowed(request)
+
+    stats = RequestDBStats()
+    stats_token = request_db_stats.set(stats)
+    start = time.perf_counter()
+    status_code = 500
+
+    try:
+        if profiling:
+            with RequestProfiler(request, stats) as profiler:
+                response = await call_next(request)
+
+            response.headers["X-Profile-Id"] = profiler.save(response.status_code)
+        else:
+            response = await call_next(request)
+
+        status_code = response.status_code
+
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        route = request.scope.get("route")
+        route_path = route.path if route else "unmatched"
+
+        http_request_duration_seconds.observe(elapsed, request.method, route_path, str(status_code))
+        http_request_db_queries.observe(stats.query_count, request.method, route_path)
+        http_request_db_duration_seconds.observe(stats.db_time, request.method, route_path)
+
+        request_db_stats.reset(stats_token)
+
 
 # router
 app.include_router(base.router, prefix="", tags=["base"])
 app.include_router(reservation.router, prefix="/api", tags=["reservations"])
+app.include_router(capacity_calendar.router, prefix="/api", tags=["capacity_calendar"])
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, Date, Index
+
+from app.db.base import Base
+
+
+class CapacityCalendar(Base):
+    __tablename__ = "capacity_calendar"
+
+    target_date = Column(Date, nullable=False)
+    # 비어 있으면 날짜 전체, 값이 있으면 해당 시(0~23)에 시작하는 시간대에 적용
+    hour = Column(Integer, nullable=True)
+    capacity = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # 날짜 전체 정원(hour가 NULL)도 날짜별로 하나만 존재하도록 NULL을 같은 값으로 취급한다
+        Index(
+            "idx_capacity_calendar_target_date_hour",
+            "target_date",
+            "hour",
+            unique=True,
+            postgresql_nulls_not_distinct=True
+        ),
+    )
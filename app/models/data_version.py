@@ -0,0 +1,16 @@
+from sqlalchemy import Column, BigInteger, String, Index
+
+from app.db.base import Base
+
+
+class DataVersion(Base):
+    __tablename__ = "data_version"
+
+    # date: 날짜별 확정 인원/정원, user: 사용자별 예약 목록
+    scope = Column(String(16), nullable=False)
+    key = Column(String(32), nullable=False)
+    version = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_data_version_scope_key", "scope", "key", unique=True),
+    )
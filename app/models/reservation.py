@@ -21,5 +21,9 @@ class ReservationInfo(Base):
     state = Column(Enum(ReservationState), nullable=False)
 
     __table_args__ = (
-        Index("idx_reservation_time", "start_time", "end_time", postgresql_using="brin"),
+        # 예약 목록 조회 (정렬 및 cursor)
+        Index("idx_reservation_start_time_idx", "start_time", "idx"),
+        Index("idx_reservation_user_start_time_idx", "user_idx", "start_time", "idx"),
+        # 고객별 확정 예약 일정 겹침 확인, 날짜별 확정 예약 조회
+        Index("idx_reservation_user_state_time", "user_idx", "state", "start_time", "end_time"),
     )
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, DateTime, Index
+
+from app.db.base import Base
+
+
+class SlotCapacity(Base):
+    __tablename__ = "slot_capacity"
+
+    slot_time = Column(DateTime, nullable=False)
+    applicant_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_slot_capacity_slot_time", "slot_time", unique=True),
+    )
+
+
+class SlotCapacitySetting(Base):
+    __tablename__ = "slot_capacity_setting"
+
+    # 집계 단위(분). 설정(RESERVATION_SLOT_MINUTES)과 다르면 집계를 다시 계산해야 한다
+    slot_minutes = Column(Integer, nullable=False)
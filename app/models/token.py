@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import Column, Integer, Enum, DateTime, String
+from sqlalchemy import Column, Integer, Enum, DateTime, String, Index
 
 from app.db.base import Base
 
@@ -15,5 +15,10 @@ class TokenInfo(Base):
 
     user_idx = Column(Integer, nullable=False)
     user_type = Column(Enum(UserType), nullable=False)
-    token = Column(String, nullable=False)
+    # 토큰 원문은 저장하지 않고 SHA-256 해시(hex)만 저장한다
+    token_hash = Column(String(64), nullable=False)
     expired_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("idx_token_info_token_hash", "token_hash", unique=True),
+    )
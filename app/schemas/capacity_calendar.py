@@ -0,0 +1,41 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, model_validator
+
+from app.schemas.base import InfoBaseModel
+
+
+class CapacityCalendar(InfoBaseModel):
+    target_date: date
+    hour: Optional[int]
+    capacity: int
+
+
+class CapacityCalendarDeleteRequest(BaseModel):
+    target_date: date
+    hour: Optional[int] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def check_hour(cls, data):
+        hour = data.get("hour", None)
+
+        if isinstance(hour, int) and not (0 <= hour <= 23):
+            raise ValueError("유효하지 않은 시간입니다. 0 이상 23 이하의 수를 입력해주세요.")
+
+        return data
+
+
+class CapacityCalendarPutRequest(CapacityCalendarDeleteRequest):
+    capacity: int
+
+    @model_validator(mode="before")
+    @classmethod
+    def check_capacity(cls, data):
+        capacity = data.get("capacity", None)
+
+        if isinstance(capacity, int) and capacity < 0:
+            raise ValueError("유효하지 않은 정원입니다. 0 이상의 수를 입력해주세요.")
+
+        return data
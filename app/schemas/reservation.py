@@ -4,6 +4,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel, model_validator
 
+from app.core.config import settings
 from app.schemas.base import InfoBaseModel
 
 
@@ -51,8 +52,8 @@ class ReservationBaseModel(BaseModel):
         if start_time and end_time and start_time >= end_time:
             raise ValueError("시작 시간이 종료 시간보다 같거나 늦을 수 없습니다.")
 
-        if not (0 < applicant_count <= 50000):
-            raise ValueError("유효하지 않은 신청자 수입니다. 1 이상 50000 이하의 수를 입력해주세요.")
+        if not (0 < applicant_count <= settings.MAX_APPLICANT_COUNT):
+            raise ValueError(f"유효하지 않은 신청자 수입니다. 1 이상 {settings.MAX_APPLICANT_COUNT} 이하의 수를 입력해주세요.")
 
         return data
 
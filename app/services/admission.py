@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import reservation_admission_batch_size
+from app.db.session import AsyncSessionLocal
+from app.models.reservation import ReservationInfo
+from app.schemas.user import UserInfo
+from app.services.reservation import ReservationService
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionQueue:
+    def __init__(self, window: float, max_size: int):
+        self.window = window
+        self.max_size = max_size
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def start(self):
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if not self.task:
+            return
+
+        self.task.cancel()
+
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+        self.task = None
+
+        # 처리되지 못한 요청은 실패로 응답한다
+        while not self.queue.empty():
+            future, _ = self.queue.get_nowait()
+
+            if not future.done():
+                future.set_exception(RuntimeError("예약 신청 대기열이 종료되었습니다."))
+
+    async def submit(self, user_info: UserInfo, start_time: datetime, end_time: datetime, applicant_count: int) -> ReservationInfo:
+        future = asyncio.get_running_loop().create_future()
+
+        self.queue.put_nowait((
+            future,
+            dict(user_info=user_info, start_time=start_time, end_time=end_time, applicant_count=applicant_count)
+        ))
+
+        return await future
+
+    async def collect(self) -> List[Tuple[asyncio.Future, dict]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + self.window
+
+        while len(batch) < self.max_size:
+            timeout = deadline - loop.time()
+
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # 대기 시간이 끝난 시점에 이미 쌓여 있는 요청도 함께 처리
+        while len(batch) < self.max_size and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+
+        # 응답을 기다리지 않는(연결이 끊긴) 요청은 처리하지 않는다
+        return [item for item in batch if not item[0].done()]
+
+    async def run(self):
+        while True:
+            batch = await self.collect()
+
+            if batch:
+                await self.process(batch)
+
+    async def process(self, batch: List[Tuple[asyncio.Future, dict]]):
+        reservation_admission_batch_size.observe(len(batch))
+
+        try:
+            # 커밋 후 세션 밖에서 응답을 만들 수 있도록 만료시키지 않는다
+            async with AsyncSessionLocal(expire_on_commit=False) as db:
+                results = await ReservationService.insert_reservations_async(
+                    db,
+                    reservation_requests=[request for _, request in batch]
+                )
+        except Exception as e:
+            logger.exception("예약 신청 일괄 처리에 실패했습니다.")
+
+            for future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        for (future, _), result in zip(batch, results):
+            if future.done():
+                continue
+
+            if isinstance(result, ValueError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+admission_queue = AdmissionQueue(settings.ADMISSION_BATCH_WINDOW_MS / 1000, settings.ADMISSION_BATCH_SIZE)
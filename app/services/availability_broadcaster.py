@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+AvailableTimesFetcher = Callable[[List[date]], Awaitable[Dict[date, List[dict]]]]
+
+
+class AvailabilityBroadcaster:
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self.subscribers: Dict[date, Set[asyncio.Queue]] = defaultdict(set)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.fetch: Optional[AvailableTimesFetcher] = None
+        self.pending_dates: Set[date] = set()
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self.loop is not None
+
+    def start(self, fetch: AvailableTimesFetcher):
+        self.loop = asyncio.get_running_loop()
+        self.fetch = fetch
+
+    async def stop(self):
+        self.loop = None
+
+        if self.task:
+            self.task.cancel()
+
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+            self.task = None
+
+        # 구독 스트림을 종료시킨다
+        for queues in self.subscribers.values():
+            for queue in queues:
+                self.put(queue, None)
+
+        self.subscribers.clear()
+        self.pending_dates.clear()
+
+    def subscribe(self, target_date: date) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers[target_date].add(queue)
+
+        return queue
+
+    def unsubscribe(self, target_date: date, queue: asyncio.Queue):
+        queues = self.subscribers.get(target_date)
+
+        if queues is None:
+            return
+
+        queues.discard(queue)
+
+        if not queues:
+            del self.subscribers[target_date]
+
+    def publish(self, dates: Iterable[date]):
+        # 서비스 로직은 다른 스레드에서도 실행되므로 이벤트 루프로 넘겨서 처리한다
+        loop = self.loop
+
+        if loop is None:
+            return
+
+        try:
+            loop.call_soon_threadsafe(self.schedule, set(dates))
+        except RuntimeError:
+            pass
+
+    def schedule(self, dates: Set[date]):
+        dates = { target_date for target_date in dates if target_date in self.subscribers }
+
+        if not dates or not self.running:
+            return
+
+        self.pending_dates |= dates
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.flush())
+
+    async def flush(self):
+        # 조회 중에 들어온 변경은 모아서 다음 조회 한 번으로 처리한다
+        while self.pending_dates:
+            dates = sorted(self.pending_dates)
+            self.pending_dates.clear()
+
+            try:
+                available_times = await self.fetch(dates)
+            except Exception:
+                logger.exception("예약 가능 인원 변경을 전송하지 못했습니다.")
+                continue
+
+            for target_date, times in available_times.items():
+                for queue in list(self.subscribers.get(target_date, ())):
+                    self.put(queue, times)
+
+    @staticmethod
+    def put(queue: asyncio.Queue, message):
+        # 느린 구독자는 최신 상태만 받으면 되므로 오래된 메시지를 버린다
+        if queue.full():
+            queue.get_nowait()
+
+        queue.put_nowait(message)
+
+
+availability_broadcaster = AvailabilityBroadcaster(settings.SUBSCRIPTION_QUEUE_SIZE)
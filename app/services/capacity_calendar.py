@@ -0,0 +1,155 @@
+from array import array
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.session import is_cacheable_read
+from app.models.capacity_calendar import CapacityCalendar
+from app.services.data_version import DataVersionService
+from app.services.invalidation_bus import invalidation_bus
+from app.services.slot_capacity import SlotCapacityService
+
+capacity_calendar_cache = TTLCache(settings.CAPACITY_CALENDAR_CACHE_SIZE, settings.CAPACITY_CALENDAR_CACHE_TTL)
+
+
+class CapacityCalendarService:
+    @staticmethod
+    def get_day_capacities(
+        db: Session,
+        dates: List[date],
+        date_versions: Optional[Dict[date, int]] = None,
+        use_cache: bool = True
+    ) -> Dict[date, Dict[Optional[int], int]]:
+        cache_generation = capacity_calendar_cache.generation
+
+        day_capacities = {}
+        missing_dates = []
+
+        for target_date in set(dates):
+            cached = capacity_calendar_cache.get(target_date) if use_cache else None
+
+            # 버전이 주어진 경우 다른 프로세스에서 변경된 날짜의 캐시는 사용하지 않는다
+            if cached is None or (date_versions is not None and cached[0] != date_versions.get(target_date, 0)):
+                missing_dates.append(target_date)
+            else:
+                day_capacities[target_date] = cached[1]
+
+        if missing_dates:
+            for target_date in missing_dates:
+                day_capacities[target_date] = {}
+
+            for calendar in db.query(
+                CapacityCalendar.target_date,
+                CapacityCalendar.hour,
+                CapacityCalendar.capacity
+            ).filter(
+                CapacityCalendar.target_date.in_(missing_dates)
+            ):
+                day_capacities[calendar.target_date][calendar.hour] = calendar.capacity
+
+            if is_cacheable_read(db):
+                for target_date in missing_dates:
+                    capacity_calendar_cache.set(
+                        target_date,
+                        (date_versions.get(target_date, 0) if date_versions is not None else None, day_capacities[target_date]),
+                        generation=cache_generation
+                    )
+
+        return day_capacities
+
+    @classmethod
+    def get_slot_capacities(
+        cls,
+        db: Session,
+        start_time: datetime,
+        end_time: datetime,
+        date_versions: Optional[Dict[date, int]] = None,
+        use_cache: bool = True
+    ) -> array:
+        slot_times = SlotCapacityService.get_slot_times(start_time, end_time)
+        day_capacities = cls.get_day_capacities(db, [slot_time.date() for slot_time in slot_times], date_versions, use_cache)
+
+        # 시간별 정원 > 날짜별 정원 > 기본 정원 순으로 적용
+        return array("l", (
+            day_capacities[slot_time.date()].get(
+                slot_time.hour,
+                day_capacities[slot_time.date()].get(None, settings.MAX_APPLICANT_COUNT)
+            )
+            for slot_time in slot_times
+        ))
+
+    @staticmethod
+    def get_calendar(db: Session, start_date: Optional[date] = None, end_date: Optional[date] = None):
+        calendar = db.query(CapacityCalendar)
+
+        if start_date:
+            calendar = calendar.filter(CapacityCalendar.target_date >= start_date)
+
+        if end_date:
+            calendar = calendar.filter(CapacityCalendar.target_date <= end_date)
+
+        return calendar.order_by(
+            CapacityCalendar.target_date,
+            CapacityCalendar.hour.nullsfirst()
+        ).all()
+
+    @staticmethod
+    def get_calendar_entry(db: Session, target_date: date, hour: Optional[int] = None):
+        return db.query(CapacityCalendar).filter(
+            CapacityCalendar.target_date == target_date,
+            CapacityCalendar.hour == hour if hour is not None else CapacityCalendar.hour.is_(None)
+        ).with_for_update().first()
+
+    @staticmethod
+    def set_capacity(db: Session, target_date: date, capacity: int, hour: Optional[int] = None):
+        # 행이 없을 때는 잠글 대상이 없으므로 동시 요청이 모두 추가하지 않도록 한 문장으로 처리한다
+        statement = insert(CapacityCalendar).values(target_date=target_date, hour=hour, capacity=capacity)
+        statement = statement.on_conflict_do_update(
+            index_elements=[CapacityCalendar.target_date, CapacityCalendar.hour],
+            set_={
+                "capacity": statement.excluded.capacity,
+                "updated_at": datetime.now(),
+            }
+        ).returning(CapacityCalendar)
+
+        calendar = db.scalars(statement, execution_options=dict(populate_existing=True)).one()
+
+        DataVersionService.bump_dates(db, [target_date])
+        invalidation_bus.notify(db, dates=[target_date])
+        db.commit()
+        db.refresh(calendar)
+
+        capacity_calendar_cache.delete(target_date)
+
+        return calendar
+
+    @classmethod
+    def delete_capacity(cls, db: Session, target_date: date, hour: Optional[int] = None):
+        calendar = cls.get_calendar_entry(db, target_date, hour)
+
+        if not calendar:
+            raise ValueError("정원 정보가 존재하지 않습니다.")
+
+        db.delete(calendar)
+        DataVersionService.bump_dates(db, [target_date])
+        invalidation_bus.notify(db, dates=[target_date])
+        db.commit()
+
+        capacity_calendar_cache.delete(target_date)
+
+    @classmethod
+    async def get_calendar_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.get_calendar, **kwargs)
+
+    @classmethod
+    async def set_capacity_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.set_capacity, **kwargs)
+
+    @classmethod
+    async def delete_capacity_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.delete_capacity, **kwargs)
@@ -0,0 +1,85 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Set, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.data_version import DataVersion
+
+
+def get_dates(*time_ranges: Tuple[datetime, datetime]) -> Set[date]:
+    dates = set()
+
+    for start_time, end_time in time_ranges:
+        current_date = start_time.date()
+
+        while current_date <= end_time.date():
+            dates.add(current_date)
+            current_date += timedelta(days=1)
+
+    return dates
+
+
+class DataVersionService:
+    date_scope = "date"
+    user_scope = "user"
+
+    @staticmethod
+    def bump(db: Session, scope: str, keys: Iterable[str]):
+        # 같은 행을 갱신하는 트랜잭션끼리 교착되지 않도록 정렬된 순서로 잠근다
+        values = [dict(scope=scope, key=key, version=1) for key in sorted(set(keys))]
+
+        if not values:
+            return
+
+        statement = insert(DataVersion).values(values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[DataVersion.scope, DataVersion.key],
+            set_={
+                "version": DataVersion.version + 1,
+                "updated_at": datetime.now(),
+            }
+        )
+        db.execute(statement)
+
+    @classmethod
+    def bump_dates(cls, db: Session, dates: Iterable[date]):
+        cls.bump(db, cls.date_scope, (target_date.isoformat() for target_date in dates))
+
+    @classmethod
+    def bump_users(cls, db: Session, user_idx_list: Iterable[int]):
+        cls.bump(db, cls.user_scope, (str(user_idx) for user_idx in user_idx_list))
+
+    @classmethod
+    def get_versions(cls, db: Session, dates: Iterable[date] = (), user_idx_list: Iterable[int] = ()) -> Tuple[Dict[date, int], Dict[int, int]]:
+        # 변경된 적 없는 날짜/사용자는 0
+        date_versions = { target_date: 0 for target_date in dates }
+        user_versions = { user_idx: 0 for user_idx in user_idx_list }
+        conditions = []
+
+        if date_versions:
+            conditions.append(and_(
+                DataVersion.scope == cls.date_scope,
+                DataVersion.key.in_([target_date.isoformat() for target_date in date_versions])
+            ))
+
+        if user_versions:
+            conditions.append(and_(
+                DataVersion.scope == cls.user_scope,
+                DataVersion.key.in_([str(user_idx) for user_idx in user_versions])
+            ))
+
+        if conditions:
+            for data_version in db.query(DataVersion.scope, DataVersion.key, DataVersion.version).filter(or_(*conditions)):
+                if data_version.scope == cls.date_scope:
+                    date_versions[date.fromisoformat(data_version.key)] = data_version.version
+                else:
+                    user_versions[int(data_version.key)] = data_version.version
+
+        return date_versions, user_versions
+
+    @classmethod
+    async def get_versions_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.get_versions, **kwargs)
@@ -0,0 +1,192 @@
+import bisect
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.reservation import ReservationInfo, ReservationState
+from app.services.slot_capacity import SlotCapacityService
+
+logger = logging.getLogger(__name__)
+
+
+class ConfirmedIntervalIndex:
+    def __init__(self):
+        self.lock = threading.RLock()
+        # 검증은 한 번에 하나씩만 실행한다 (조회 경로는 막지 않는다)
+        self.validate_lock = threading.Lock()
+        # 검증을 위해 DB를 읽는 동안 반영된 예약 idx
+        self.changed_idx_set: Optional[Set[int]] = None
+        self.loaded = False
+        # idx -> (user_idx, start_time, end_time, applicant_count)
+        self.reservations: Dict[int, Tuple[int, datetime, datetime, int]] = {}
+        # user_idx -> [(start_time, end_time, idx), ...] (시작 시간순)
+        self.user_intervals: Dict[int, List[Tuple[datetime, datetime, int]]] = defaultdict(list)
+        self.slot_counts: Dict[datetime, int] = defaultdict(int)
+
+    @staticmethod
+    def load_reservations(db: Session, idx_list: Optional[List[int]] = None) -> Dict[int, Tuple[int, datetime, datetime, int]]:
+        query = db.query(
+            ReservationInfo.idx,
+            ReservationInfo.user_idx,
+            ReservationInfo.start_time,
+            ReservationInfo.end_time,
+            ReservationInfo.applicant_count
+        ).filter(
+            ReservationInfo.state == ReservationState.confirmed
+        )
+
+        if idx_list is not None:
+            query = query.filter(ReservationInfo.idx.in_(idx_list))
+
+        reservations = query.yield_per(10000)
+
+        return {
+            reservation.idx: (reservation.user_idx, reservation.start_time, reservation.end_time, reservation.applicant_count)
+            for reservation in reservations
+        }
+
+    @staticmethod
+    def build(reservations: Dict[int, Tuple[int, datetime, datetime, int]]):
+        user_intervals = defaultdict(list)
+        slot_counts = defaultdict(int)
+
+        for idx, (user_idx, start_time, end_time, applicant_count) in reservations.items():
+            user_intervals[user_idx].append((start_time, end_time, idx))
+            SlotCapacityService.add_delta(slot_counts, start_time, end_time, applicant_count)
+
+        for intervals in user_intervals.values():
+            intervals.sort()
+
+        return user_intervals, slot_counts
+
+    def record_change(self, idx: int):
+        if self.changed_idx_set is not None:
+            self.changed_idx_set.add(idx)
+
+    def add(self, idx: int, user_idx: int, start_time: datetime, end_time: datetime, applicant_count: int):
+        with self.lock:
+            self.remove(idx)
+            self.record_change(idx)
+
+            self.reservations[idx] = (user_idx, start_time, end_time, applicant_count)
+            bisect.insort(self.user_intervals[user_idx], (start_time, end_time, idx))
+            SlotCapacityService.add_delta(self.slot_counts, start_time, end_time, applicant_count)
+
+    def remove(self, idx: int):
+        with self.lock:
+            self.record_change(idx)
+            reservation = self.reservations.pop(idx, None)
+
+            if not reservation:
+                return
+
+            user_idx, start_time, end_time, applicant_count = reservation
+
+            intervals = self.user_intervals[user_idx]
+            del intervals[bisect.bisect_left(intervals, (start_time, end_time, idx))]
+
+            if not intervals:
+                del self.user_intervals[user_idx]
+
+            for slot_time in SlotCapacityService.get_slot_times(start_time, end_time):
+                self.slot_counts[slot_time] -= applicant_count
+
+                if not self.slot_counts[slot_time]:
+                    del self.slot_counts[slot_time]
+
+    def refresh(self, db: Session, idx_list: List[int]):
+        # 다른 프로세스에서 변경된 예약만 DB 기준으로 다시 반영
+        reservations = self.load_reservations(db, idx_list)
+
+        for idx in idx_list:
+            if idx in reservations:
+                self.add(idx, *reservations[idx])
+            else:
+                self.remove(idx)
+
+    def find_overlap(self, user_idx: int, start_time: datetime, end_time: datetime, exclude_idx: Optional[int] = None) -> Optional[int]:
+        with self.lock:
+            intervals = self.user_intervals.get(user_idx, [])
+            position = bisect.bisect_left(intervals, (end_time,))
+
+            # 한 사용자의 확정된 예약끼리는 겹치지 않으므로 종료 시간도 시작 시간순으로 정렬되어 있다
+            while position > 0:
+                position -= 1
+                interval_start, interval_end, idx = intervals[position]
+
+                if idx == exclude_idx:
+                    continue
+
+                return idx if interval_end > start_time else None
+
+            return None
+
+    def get_slot_counts(self, start_time: datetime, end_time: datetime, exclude_idx: Optional[int] = None) -> Dict[datetime, int]:
+        with self.lock:
+            slot_counts = {
+                slot_time: self.slot_counts[slot_time]
+                for slot_time in SlotCapacityService.get_slot_times(start_time, end_time)
+                if slot_time in self.slot_counts
+            }
+
+            if exclude_idx in self.reservations:
+                _, excluded_start_time, excluded_end_time, excluded_applicant_count = self.reservations[exclude_idx]
+
+                for slot_time in SlotCapacityService.get_slot_times(excluded_start_time, excluded_end_time):
+                    if slot_time in slot_counts:
+                        slot_counts[slot_time] -= excluded_applicant_count
+
+            return slot_counts
+
+    def validate(self, db: Session) -> List[int]:
+        with self.validate_lock:
+            with self.lock:
+                self.changed_idx_set = set()
+
+            try:
+                return self.reconcile(db)
+            finally:
+                self.changed_idx_set = None
+
+    def reconcile(self, db: Session) -> List[int]:
+        reservations = self.load_reservations(db)
+        # 비교와 재구성은 잠금 없이 복사본으로 수행하여 조회 경로를 막지 않는다
+        current_reservations = self.reservations.copy()
+
+        # DB를 읽는 동안 쓰기 경로에서 반영된 예약은 스냅샷보다 최신이므로 차이로 보지 않는다
+        drift = sorted(
+            idx for idx in current_reservations.keys() | reservations.keys()
+            if current_reservations.get(idx) != reservations.get(idx) and idx not in self.changed_idx_set
+        )
+
+        if self.loaded and not drift:
+            return []
+
+        if drift and self.loaded:
+            logger.warning("확정 예약 인덱스가 DB와 %d건 다릅니다. 인덱스를 다시 적재합니다.", len(drift))
+
+        user_intervals, slot_counts = self.build(reservations)
+
+        with self.lock:
+            changed_reservations = { idx: self.reservations.get(idx) for idx in self.changed_idx_set }
+            self.changed_idx_set = None
+
+            self.reservations = reservations
+            self.user_intervals = user_intervals
+            self.slot_counts = slot_counts
+            self.loaded = True
+
+            # 스냅샷 이후의 변경을 다시 반영
+            for idx, reservation in changed_reservations.items():
+                if reservation:
+                    self.add(idx, *reservation)
+                else:
+                    self.remove(idx)
+
+        return drift
+
+confirmed_interval_index = ConfirmedIntervalIndex()
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import uuid
+from datetime import date
+from typing import Awaitable, Callable, Iterable, Optional
+
+import asyncpg
+import orjson
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.serializer import dumps
+from app.db.base import async_engine
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY 메시지 최대 크기(8000 bytes)보다 작게 유지
+MAX_PAYLOAD_SIZE = 7900
+
+InvalidationHandler = Callable[[dict], Awaitable[None]]
+
+
+class InvalidationBus:
+    def __init__(self, channel: str):
+        self.channel = channel
+        # 자신이 보낸 변경은 이미 반영했으므로 수신 시 건너뛴다
+        self.origin = uuid.uuid4().hex
+        self.handler: Optional[InvalidationHandler] = None
+        self.queue: Optional[asyncio.Queue] = None
+        self.tasks = []
+
+    def encode(self, dates: Optional[Iterable[date]], reservation_idx_list: Optional[Iterable[int]], tokens: bool) -> str:
+        message = dict(
+            origin=self.origin,
+            dates=sorted(set(dates)) if dates is not None else None,
+            reservations=sorted(set(reservation_idx_list)) if reservation_idx_list is not None else None,
+            tokens=tokens
+        )
+        payload = dumps(message)
+
+        # 크기를 넘으면 전체 무효화로 보낸다
+        if len(payload) > MAX_PAYLOAD_SIZE:
+            message["reservations"] = None
+            payload = dumps(message)
+
+        if len(payload) > MAX_PAYLOAD_SIZE:
+            message["dates"] = None
+            payload = dumps(message)
+
+        return payload.decode()
+
+    def notify(
+        self,
+        db: Session,
+        dates: Optional[Iterable[date]] = (),
+        reservation_idx_list: Optional[Iterable[int]] = (),
+        tokens: bool = False
+    ):
+        # 트랜잭션 안에서 보내므로 커밋된 경우에만 다른 워커에 전달된다
+        db.execute(select(func.pg_notify(self.channel, self.encode(dates, reservation_idx_list, tokens))))
+
+    def start(self, handler: InvalidationHandler):
+        self.handler = handler
+        self.queue = asyncio.Queue()
+        self.tasks = [asyncio.create_task(self.listen()), asyncio.create_task(self.run())]
+
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        self.tasks = []
+
+    def receive(self, connection, pid, channel, payload):
+        try:
+            message = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning("잘못된 캐시 무효화 메시지입니다: %s", payload)
+            return
+
+        if message.get("origin") != self.origin:
+            self.queue.put_nowait(message)
+
+    async def listen(self):
+        # 풀에 반환되지 않도록 LISTEN 전용 연결을 사용한다
+        dsn = async_engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        reconnecting = False
+
+        while True:
+            connection = None
+
+            try:
+                connection = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(self.channel, self.receive)
+
+                # 연결이 끊긴 동안의 변경은 알 수 없으므로 전체를 무효화한다
+                if reconnecting:
+                    self.queue.put_nowait(dict(dates=None, reservations=None, tokens=True))
+
+                while not closed.is_set():
+                    try:
+                        await asyncio.wait_for(closed.wait(), settings.INVALIDATION_PING_INTERVAL)
+                    except asyncio.TimeoutError:
+                        await connection.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("캐시 무효화 수신 연결이 끊어졌습니다.")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+
+            reconnecting = True
+            await asyncio.sleep(settings.INVALIDATION_RECONNECT_INTERVAL)
+
+    async def run(self):
+        while True:
+            message = await self.queue.get()
+
+            try:
+                await self.handler(message)
+            except Exception:
+                logger.exception("캐시 무효화 처리에 실패했습니다.")
+
+
+invalidation_bus = InvalidationBus(settings.INVALIDATION_CHANNEL)
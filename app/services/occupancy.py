@@ -0,0 +1,85 @@
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from app.services.slot_capacity import SlotCapacityService
+
+slots_per_day = timedelta(days=1) // SlotCapacityService.slot
+
+# 하루 안의 시간대 순번별 표시 문자열 (예: "03:00", "03:00 ~ 03:30")
+slot_labels = [
+    (datetime.min + SlotCapacityService.slot * slot_index).strftime("%H:%M")
+    for slot_index in range(slots_per_day)
+]
+slot_range_labels = [
+    f"{slot_labels[slot_index]} ~ {slot_labels[(slot_index + 1) % slots_per_day]}"
+    for slot_index in range(slots_per_day)
+]
+
+
+class SlotOccupancy:
+    def __init__(self, start_time: datetime, counts: array, capacities: array):
+        self.start_time = start_time
+        self.counts = counts
+        self.capacities = capacities
+        self.first_label_index = (start_time - start_time.replace(hour=0, minute=0, second=0, microsecond=0)) // SlotCapacityService.slot
+
+    @classmethod
+    def from_slot_counts(cls, slot_counts: Dict[datetime, int], capacities: array, start_time: datetime, end_time: datetime):
+        return cls(
+            start_time,
+            array("l", (slot_counts.get(slot_time, 0) for slot_time in SlotCapacityService.get_slot_times(start_time, end_time))),
+            capacities
+        )
+
+    def get_slot_index(self, slot_time: datetime) -> int:
+        return min(max((slot_time - self.start_time) // SlotCapacityService.slot, 0), len(self.counts))
+
+    def get_user_mask(self, reservations) -> int:
+        # 예약 시작 시간대부터 종료 시각이 속한 시간대 직전까지를 사용자의 예약 시간대로 표시
+        mask = 0
+
+        for reservation in reservations:
+            first_index = self.get_slot_index(SlotCapacityService.floor_slot(reservation.start_time))
+            last_index = self.get_slot_index(SlotCapacityService.floor_slot(reservation.end_time))
+
+            if last_index > first_index:
+                mask |= ((1 << (last_index - first_index)) - 1) << first_index
+
+        return mask
+
+    def get_available_slots(self, applicant_count: int = 0, user_mask: int = 0) -> List[int]:
+        return [
+            slot_index for slot_index, (reservation_count, capacity) in enumerate(zip(self.counts, self.capacities))
+            if reservation_count + applicant_count <= capacity and not user_mask >> slot_index & 1
+        ]
+
+    def get_available_times(self, slot_indexes: List[int]) -> List[dict]:
+        return [
+            {
+                "time": slot_range_labels[(self.first_label_index + slot_index) % slots_per_day],
+                "available_count": self.capacities[slot_index] - self.counts[slot_index]
+            }
+            for slot_index in slot_indexes
+        ]
+
+    def check_available(self, applicant_count: int):
+        available_counts = [capacity - reservation_count for reservation_count, capacity in zip(self.counts, self.capacities)]
+
+        if all(available_count >= applicant_count for available_count in available_counts):
+            return
+
+        # 신청 가능한 시간대를 먼저, 인원을 초과한 시간대를 나중에 안내
+        suggested_slots = [
+            slot_index for slot_index, available_count in enumerate(available_counts)
+            if available_count >= applicant_count and available_count > 0
+        ] + [
+            slot_index for slot_index, available_count in enumerate(available_counts)
+            if 0 < available_count < applicant_count
+        ]
+        suggested_times = "\n".join(
+            f"{slot_labels[(self.first_label_index + slot_index) % slots_per_day]} {available_counts[slot_index]}명"
+            for slot_index in suggested_slots
+        )
+
+        raise ValueError("신청 가능한 인원을 초과했습니다." + (f"\n신청 가능 시간대\n{suggested_times}" if suggested_times else ""))
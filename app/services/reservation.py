@@ -1,24 +1,50 @@
-from datetime import datetime, timedelta
-from typing import Optional, List
+import base64
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Optional, List, Dict, Union
 
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, tuple_, select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import Timer, capacity_check_duration_seconds
+from app.db.session import is_cacheable_read
 from app.models.reservation import ReservationInfo, ReservationState
 from app.schemas.user import UserInfo, UserType
+from app.services.availability_broadcaster import availability_broadcaster
+from app.services.capacity_calendar import CapacityCalendarService
+from app.services.data_version import DataVersionService, get_dates
+from app.services.invalidation_bus import invalidation_bus
+from app.services.interval_index import confirmed_interval_index
+from app.services.occupancy import SlotOccupancy, slots_per_day
+from app.services.slot_capacity import SlotCapacityService
+
+reservation_list_columns = (
+    ReservationInfo.idx,
+    ReservationInfo.user_idx,
+    ReservationInfo.start_time,
+    ReservationInfo.end_time,
+    ReservationInfo.applicant_count,
+    ReservationInfo.state,
+)
+
+available_reservation_times_cache = TTLCache(
+    max_size=settings.AVAILABILITY_CACHE_SIZE,
+    ttl=settings.AVAILABILITY_CACHE_TTL
+)
 
 
 class ReservationService:
     @staticmethod
-    def get_reservations(
+    def get_reservations_query(
         db: Session,
         user_idx: int,
         user_type: str,
-        date: Optional[datetime] = None,
-        size: Optional[int] = None,
-        page: Optional[int] = None
+        date: Optional[datetime] = None
     ):
-        reservations = db.query(ReservationInfo)
+        reservations = db.query(*reservation_list_columns)
 
         if user_type != UserType.admin:
             reservations = reservations.filter(ReservationInfo.user_idx == user_idx)
@@ -30,6 +56,20 @@ class ReservationService:
                 ReservationInfo.end_time < target_date + timedelta(days=1)
             )
 
+        return reservations.order_by(ReservationInfo.start_time, ReservationInfo.idx)
+
+    @classmethod
+    def get_reservations(
+        cls,
+        db: Session,
+        user_idx: int,
+        user_type: str,
+        date: Optional[datetime] = None,
+        size: Optional[int] = None,
+        page: Optional[int] = None
+    ):
+        reservations = cls.get_reservations_query(db, user_idx, user_type, date)
+
         if size and page:
             reservations = reservations.limit(size)
             reservations = reservations.offset(size * (page - 1))
@@ -37,61 +77,106 @@ class ReservationService:
         return reservations.all()
 
     @staticmethod
-    def get_available_reservation_times(
-        db: Session,
-        start_time: datetime,
-        end_time: datetime,
-        applicant_count: Optional[int] = None,
-        reservation_idx: Optional[int] = None
+    def get_reservations_export_statement(
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        state: Optional[ReservationState] = None,
+        user_idx: Optional[int] = None
     ):
-        start_hour = start_time.replace(minute=0, second=0, microsecond=0)
-        end_hour = end_time.replace(minute=0, second=0, microsecond=0)
+        statement = select(
+            ReservationInfo.idx,
+            ReservationInfo.user_idx,
+            ReservationInfo.start_time,
+            ReservationInfo.end_time,
+            ReservationInfo.applicant_count,
+            ReservationInfo.state,
+            ReservationInfo.created_at,
+            ReservationInfo.updated_at
+        )
 
-        if end_hour != end_time:
-            end_hour += timedelta(hours=1)
+        if start_date:
+            statement = statement.where(ReservationInfo.start_time >= start_date)
 
-        available_times = []
+        if end_date:
+            statement = statement.where(ReservationInfo.start_time < end_date + timedelta(days=1))
 
-        current_time = start_hour
-        not_available_times = []
+        if state:
+            statement = statement.where(ReservationInfo.state == state)
 
-        max_applicant_count = 50000
-        reservation_count_limit = max_applicant_count - (applicant_count or 0)
+        if user_idx:
+            statement = statement.where(ReservationInfo.user_idx == user_idx)
 
-        while current_time < end_hour:
-            next_time = current_time + timedelta(hours=1)
+        return statement.order_by(ReservationInfo.start_time, ReservationInfo.idx)
 
-            reservations = db.query(ReservationInfo.applicant_count).filter(
-                ReservationInfo.start_time <= current_time,
-                ReservationInfo.end_time >= next_time,
-                ReservationInfo.state == ReservationState.confirmed,
-                ReservationInfo.idx != reservation_idx if reservation_idx else True
-            ).all()
+    @staticmethod
+    def encode_cursor(start_time: datetime, idx: int) -> str:
+        cursor = f"{start_time.isoformat()}|{idx}"
 
-            reservation_count = sum([reservation.applicant_count for reservation in reservations])
-            available_count = max_applicant_count - reservation_count
-            current_time_str = current_time.strftime("%H:%M")
+        return base64.urlsafe_b64encode(cursor.encode()).decode().rstrip("=")
 
-            if reservation_count <= reservation_count_limit:
-                available_times.append(
-                    {
-                        "time": current_time_str,
-                        "available_count": available_count
-                    }
-                )
-            else:
-                not_available_times.append(
-                    {
-                        "time": current_time_str,
-                        "available_count": available_count
-                    }
-                )
+    @staticmethod
+    def decode_cursor(cursor: str):
+        try:
+            start_time, idx = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split("|")
 
-            current_time = next_time
+            return datetime.fromisoformat(start_time), int(idx)
+        except ValueError:
+            raise ValueError("유효하지 않은 cursor입니다.")
 
-        return dict(
-            available_times=available_times,
-            not_available_times=not_available_times,
+    @classmethod
+    def get_reservations_by_cursor(
+        cls,
+        db: Session,
+        user_idx: int,
+        user_type: str,
+        size: int,
+        date: Optional[datetime] = None,
+        cursor: Optional[str] = None
+    ):
+        reservations = cls.get_reservations_query(db, user_idx, user_type, date)
+
+        if cursor:
+            reservations = reservations.filter(
+                tuple_(ReservationInfo.start_time, ReservationInfo.idx) > tuple_(*cls.decode_cursor(cursor))
+            )
+
+        reservations = reservations.limit(size + 1).all()
+        next_cursor = cls.encode_cursor(reservations[size - 1].start_time, reservations[size - 1].idx) if len(reservations) > size else None
+
+        return reservations[:size], next_cursor
+
+    @classmethod
+    def get_available_reservation_times(
+        cls,
+        db: Session,
+        start_time: datetime,
+        end_time: datetime,
+        reservation_idx: Optional[int] = None
+    ) -> SlotOccupancy:
+        start_hour, end_hour = SlotCapacityService.get_slot_window(start_time, end_time)
+        slot_counts = SlotCapacityService.get_slot_counts(db, start_hour, end_hour)
+
+        if reservation_idx:
+            excluded_reservation = db.query(
+                ReservationInfo.start_time,
+                ReservationInfo.end_time,
+                ReservationInfo.applicant_count
+            ).filter(
+                ReservationInfo.idx == reservation_idx,
+                ReservationInfo.state == ReservationState.confirmed
+            ).first()
+
+            if excluded_reservation:
+                for slot_time in SlotCapacityService.get_slot_times(excluded_reservation.start_time, excluded_reservation.end_time):
+                    if slot_time in slot_counts:
+                        slot_counts[slot_time] -= excluded_reservation.applicant_count
+
+        # 확정 여부를 결정하는 검증이므로 다른 워커에서 변경된 정원이 캐시에 남아 있어도 사용하지 않는다
+        return SlotOccupancy.from_slot_counts(
+            slot_counts,
+            CapacityCalendarService.get_slot_capacities(db, start_hour, end_hour, use_cache=False),
+            start_hour,
+            end_hour
         )
 
     @staticmethod
@@ -126,22 +211,73 @@ class ReservationService:
     def get_exist_reservation(
         db: Session,
         user_idx: int,
-        target_date: datetime
+        target_date: datetime,
+        end_date: Optional[datetime] = None
     ):
         target_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_date = (end_date or target_date).replace(hour=0, minute=0, second=0, microsecond=0)
 
         return db.query(ReservationInfo).filter(
             ReservationInfo.user_idx == user_idx,
             ReservationInfo.start_time >= target_date,
-            ReservationInfo.end_time < target_date + timedelta(days=1),
+            ReservationInfo.end_time < end_date + timedelta(days=1),
             ReservationInfo.state == ReservationState.confirmed
         ).all()
 
+    @classmethod
+    def get_cached_day_occupancies(
+        cls,
+        db: Session,
+        dates: List[date],
+        date_versions: Optional[Dict[date, int]] = None
+    ) -> Dict[date, SlotOccupancy]:
+        cache_generation = available_reservation_times_cache.generation
+
+        day_occupancies = {}
+        missing_dates = []
+
+        for target_date in dates:
+            cached = available_reservation_times_cache.get(target_date)
+
+            # 버전이 주어진 경우 다른 프로세스에서 변경된 날짜의 캐시는 사용하지 않는다
+            if cached is None or (date_versions is not None and cached[0] != date_versions.get(target_date, 0)):
+                missing_dates.append(target_date)
+            else:
+                day_occupancies[target_date] = cached[1]
+
+        if missing_dates:
+            # 캐시에 없는 날짜들의 집계를 한 번에 조회
+            window_start = datetime.combine(min(missing_dates), time())
+            window_end = datetime.combine(max(missing_dates), time()) + timedelta(days=1)
+            slot_counts = SlotCapacityService.get_slot_counts(db, window_start, window_end)
+            window_capacities = CapacityCalendarService.get_slot_capacities(db, window_start, window_end, date_versions)
+            cacheable = is_cacheable_read(db)
+
+            for target_date in missing_dates:
+                start_time = datetime.combine(target_date, time())
+                first_slot_index = (start_time - window_start) // SlotCapacityService.slot
+
+                day_occupancies[target_date] = SlotOccupancy.from_slot_counts(
+                    slot_counts,
+                    window_capacities[first_slot_index:first_slot_index + slots_per_day],
+                    start_time,
+                    start_time + timedelta(days=1)
+                )
+
+                if cacheable:
+                    available_reservation_times_cache.set(
+                        target_date,
+                        (date_versions.get(target_date, 0) if date_versions is not None else None, day_occupancies[target_date]),
+                        generation=cache_generation
+                    )
+
+        return day_occupancies
+
     @staticmethod
-    def format_time_range(time_str):
-        start_time = datetime.strptime(time_str, "%H:%M")
-        end_time = start_time + timedelta(hours=1)
-        return f"{start_time.strftime('%H:%M')} ~ {end_time.strftime('%H:%M')}"
+    def get_available_times_for_user(day_occupancy: SlotOccupancy, exist_reservation: List[ReservationInfo]):
+        return day_occupancy.get_available_times(
+            day_occupancy.get_available_slots(user_mask=day_occupancy.get_user_mask(exist_reservation))
+        )
 
     @classmethod
     def get_available_reservation_times_for_date(
@@ -149,39 +285,61 @@ class ReservationService:
         db: Session,
         user_idx: int,
         user_type: UserType,
-        target_date: datetime
+        target_date: datetime,
+        date_versions: Optional[Dict[date, int]] = None
     ):
-        start_time = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_time = start_time + timedelta(days=1)
+        day_occupancy = cls.get_cached_day_occupancies(db, [target_date.date()], date_versions)[target_date.date()]
+
+        if not day_occupancy.get_available_slots():
+            return []
 
-        available_reservation_times = cls.get_available_reservation_times(db, start_time, end_time).get("available_times")
         exist_reservation = cls.get_exist_reservation(db, user_idx, target_date) if user_type == UserType.user else []
 
-        if not available_reservation_times:
-            return []
+        return cls.get_available_times_for_user(day_occupancy, exist_reservation)
 
-        for reservation in exist_reservation:
-            start_hour = reservation.start_time.replace(minute=0, second=0, microsecond=0).time()
-            end_hour = reservation.end_time.replace(minute=0, second=0, microsecond=0).time()
+    @classmethod
+    def get_available_reservation_times_for_date_range(
+        cls,
+        db: Session,
+        user_idx: int,
+        user_type: UserType,
+        start_date: datetime,
+        end_date: datetime,
+        date_versions: Optional[Dict[date, int]] = None
+    ):
+        dates = [start_date.date() + timedelta(days=offset) for offset in range((end_date.date() - start_date.date()).days + 1)]
+        day_occupancies = cls.get_cached_day_occupancies(db, dates, date_versions)
 
-            overlapping_times = [
-                reservation_time for reservation_time in available_reservation_times
-                if start_hour <= datetime.strptime(reservation_time["time"], "%H:%M").time() < end_hour
-            ]
+        exist_reservations = defaultdict(list)
 
-            available_reservation_times = [
-                reservation_time for reservation_time in available_reservation_times
-                if reservation_time not in overlapping_times
-            ]
+        if user_type == UserType.user:
+            for reservation in cls.get_exist_reservation(db, user_idx, start_date, end_date):
+                # 날짜별 조회와 같이 하루 안에 끝나는 예약만 해당 날짜에서 제외
+                if reservation.end_time < datetime.combine(reservation.start_time.date(), time()) + timedelta(days=1):
+                    exist_reservations[reservation.start_time.date()].append(reservation)
 
         return [
-            {
-                "time": cls.format_time_range(reservation_time["time"]),
-                "available_count": reservation_time["available_count"]
-            }
-            for reservation_time in available_reservation_times
+            dict(
+                date=target_date.strftime("%Y-%m-%d"),
+                available_times=cls.get_available_times_for_user(day_occupancies[target_date], exist_reservations[target_date])
+            )
+            for target_date in dates
         ]
 
+    @classmethod
+    def get_available_reservation_times_for_dates(cls, db: Session, dates: List[date]) -> Dict[date, List[dict]]:
+        # 사용자별 예약을 제외하지 않은 날짜 전체 기준 (관리자 조회와 동일)
+        day_occupancies = cls.get_cached_day_occupancies(db, sorted(set(dates)))
+
+        return {
+            target_date: day_occupancy.get_available_times(day_occupancy.get_available_slots())
+            for target_date, day_occupancy in day_occupancies.items()
+        }
+
+    @staticmethod
+    def invalidate_available_reservation_times(*time_ranges):
+        available_reservation_times_cache.delete(*get_dates(*time_ranges))
+
     @classmethod
     def validate_reservation(
         cls,
@@ -190,23 +348,30 @@ class ReservationService:
         start_time: datetime,
         end_time: datetime,
         applicant_count: int,
-        reservation_idx: Optional[int] = None
+        reservation_idx: Optional[int] = None,
+        use_interval_index: bool = False
     ):
+        # 확정하지 않는 요청은 DB 조회 없이 프로세스 내 인덱스로 검증하고, 확정은 잠금 아래에서 DB로 검증한다
+        if use_interval_index and confirmed_interval_index.loaded:
+            if confirmed_interval_index.find_overlap(user_idx, start_time, end_time, reservation_idx) is not None:
+                raise ValueError("일정이 겹치는 예약 정보가 존재합니다.")
+
+            start_hour, end_hour = SlotCapacityService.get_slot_window(start_time, end_time)
+
+            with Timer(capacity_check_duration_seconds, "interval_index"):
+                SlotOccupancy.from_slot_counts(
+                    confirmed_interval_index.get_slot_counts(start_hour, end_hour, reservation_idx),
+                    CapacityCalendarService.get_slot_capacities(db, start_hour, end_hour),
+                    start_hour,
+                    end_hour
+                ).check_available(applicant_count)
+            return
+
         if cls.check_user_reservation_overlap(db, user_idx, start_time, end_time, reservation_idx):
             raise ValueError("일정이 겹치는 예약 정보가 존재합니다.")
 
-        result = cls.get_available_reservation_times(db, start_time, end_time, applicant_count, reservation_idx)
-
-        available_times = result.get("available_times")
-        not_available_times = result.get("not_available_times")
-
-        if not_available_times:
-            available_times = "\n".join(
-                [f"{time['time']} {time['available_count']}명" for time in available_times + not_available_times if time["available_count"] > 0]
-            )
-            detail = "신청 가능한 인원을 초과했습니다." + (f"\n신청 가능 시간대\n{available_times}" if available_times else "")
-
-            raise ValueError(detail)
+        with Timer(capacity_check_duration_seconds, "db"):
+            cls.get_available_reservation_times(db, start_time, end_time, reservation_idx).check_available(applicant_count)
 
     @classmethod
     def insert_reservation(
@@ -223,6 +388,7 @@ class ReservationService:
             start_time=start_time,
             end_time=end_time,
             applicant_count=applicant_count,
+            use_interval_index=True
         )
 
         new_reservation = ReservationInfo(
@@ -234,11 +400,66 @@ class ReservationService:
         )
 
         db.add(new_reservation)
+        DataVersionService.bump_users(db, [user_info.idx])
         db.commit()
         db.refresh(new_reservation)
 
+        cls.invalidate_available_reservation_times((start_time, end_time))
+
         return new_reservation
 
+    @classmethod
+    def insert_reservations(cls, db: Session, reservation_requests: List[dict]) -> List[Union[ReservationInfo, ValueError]]:
+        # 요청들이 속한 날짜의 정원을 한 번에 조회해 두고, 각 요청은 같은 확정 예약 인덱스/정원 기준으로 검증한다
+        CapacityCalendarService.get_day_capacities(
+            db,
+            list(get_dates(*((request["start_time"], request["end_time"]) for request in reservation_requests)))
+        )
+
+        results: List[Union[ReservationInfo, ValueError, None]] = [None] * len(reservation_requests)
+        positions = []
+        insert_data = []
+
+        for position, request in enumerate(reservation_requests):
+            try:
+                cls.validate_reservation(
+                    db=db,
+                    user_idx=request["user_info"].idx,
+                    start_time=request["start_time"],
+                    end_time=request["end_time"],
+                    applicant_count=request["applicant_count"],
+                    use_interval_index=True
+                )
+            except ValueError as e:
+                results[position] = e
+                continue
+
+            positions.append(position)
+            insert_data.append(
+                dict(
+                    user_idx=request["user_info"].idx,
+                    start_time=request["start_time"],
+                    end_time=request["end_time"],
+                    applicant_count=request["applicant_count"],
+                    state=ReservationState.pending,
+                )
+            )
+
+        if insert_data:
+            new_reservations = db.scalars(
+                insert(ReservationInfo).returning(ReservationInfo, sort_by_parameter_order=True),
+                insert_data
+            ).all()
+            DataVersionService.bump_users(db, (data["user_idx"] for data in insert_data))
+            db.commit()
+
+            for position, new_reservation in zip(positions, new_reservations):
+                results[position] = new_reservation
+
+            cls.invalidate_available_reservation_times(*((data["start_time"], data["end_time"]) for data in insert_data))
+
+        return results
+
     @classmethod
     def update_reservation(
         cls,
@@ -251,7 +472,7 @@ class ReservationService:
         applicant_count: Optional[int] = None,
         state: Optional[ReservationState] = None
     ):
-        reservation_info = db.query(ReservationInfo).filter(ReservationInfo.idx == reservation_idx).first()
+        reservation_info = db.query(ReservationInfo).filter(ReservationInfo.idx == reservation_idx).with_for_update().first()
 
         if not reservation_info:
             raise ValueError("예약 정보가 존재하지 않습니다.")
@@ -265,6 +486,21 @@ class ReservationService:
         if reservation_info.state == ReservationState.confirmed and user_type != UserType.admin:
             raise ValueError("확정된 예약 정보는 관리자만 수정할 수 있습니다.")
 
+        if state:
+            # 요청 스키마의 ReservationState도 모델의 상태 값과 비교할 수 있도록 변환
+            state = ReservationState(state.value)
+
+        previous_time_range = (reservation_info.start_time, reservation_info.end_time)
+        slot_deltas = defaultdict(int)
+
+        if reservation_info.state == ReservationState.confirmed:
+            SlotCapacityService.add_delta(
+                slot_deltas,
+                reservation_info.start_time,
+                reservation_info.end_time,
+                -reservation_info.applicant_count
+            )
+
         if start_time:
             reservation_info.start_time = start_time
 
@@ -274,21 +510,67 @@ class ReservationService:
         if applicant_count:
             reservation_info.applicant_count = applicant_count
 
+        if state and (user_type == UserType.admin or state == ReservationState.canceled):
+            next_state = state
+        else:
+            next_state = reservation_info.state
+
+        if next_state == ReservationState.confirmed:
+            # 같은 시간대를 확정하는 요청끼리만 직렬화되도록 검증 전에 해당 시간대의 집계 행을 잠근다
+            SlotCapacityService.lock_slots(
+                db,
+                list(slot_deltas) + SlotCapacityService.get_slot_times(
+                    *SlotCapacityService.get_slot_window(reservation_info.start_time, reservation_info.end_time)
+                )
+            )
+
         cls.validate_reservation(
             db=db,
             user_idx=reservation_info.user_idx,
             start_time=reservation_info.start_time,
             end_time=reservation_info.end_time,
             applicant_count=reservation_info.applicant_count,
-            reservation_idx=reservation_info.idx
+            reservation_idx=reservation_info.idx,
+            use_interval_index=next_state != ReservationState.confirmed
         )
 
-        if state and (user_type == UserType.admin or state == ReservationState.canceled):
-            reservation_info.state = state
+        reservation_info.state = next_state
+
+        if reservation_info.state == ReservationState.confirmed:
+            SlotCapacityService.add_delta(
+                slot_deltas,
+                reservation_info.start_time,
+                reservation_info.end_time,
+                reservation_info.applicant_count
+            )
+
+        changed_dates = { slot_time.date() for slot_time, delta in slot_deltas.items() if delta }
+
+        SlotCapacityService.apply_deltas(db, slot_deltas)
+        DataVersionService.bump_dates(db, changed_dates)
+        DataVersionService.bump_users(db, [reservation_info.user_idx])
+        invalidation_bus.notify(db, dates=changed_dates, reservation_idx_list=[reservation_info.idx])
 
         db.commit()
         db.refresh(reservation_info)
 
+        if reservation_info.state == ReservationState.confirmed:
+            confirmed_interval_index.add(
+                reservation_info.idx,
+                reservation_info.user_idx,
+                reservation_info.start_time,
+                reservation_info.end_time,
+                reservation_info.applicant_count
+            )
+        else:
+            confirmed_interval_index.remove(reservation_info.idx)
+
+        cls.invalidate_available_reservation_times(
+            previous_time_range,
+            (reservation_info.start_time, reservation_info.end_time)
+        )
+        availability_broadcaster.publish(changed_dates)
+
         return reservation_info
 
     @classmethod
@@ -301,16 +583,99 @@ class ReservationService:
         if user_type != UserType.admin:
             raise ValueError("관리자만 이용 가능한 기능입니다.")
 
+        reservations = {
+            reservation.idx: reservation
+            for reservation in db.query(
+                ReservationInfo.idx,
+                ReservationInfo.user_idx,
+                ReservationInfo.start_time,
+                ReservationInfo.end_time,
+                ReservationInfo.applicant_count,
+                ReservationInfo.state
+            ).filter(
+                ReservationInfo.idx.in_(set(reservation_idx_list))
+            ).order_by(
+                ReservationInfo.idx
+            ).with_for_update()
+        }
+        candidates = [reservation for reservation in reservations.values() if reservation.state != ReservationState.canceled]
+
+        if candidates:
+            window_start, window_end = SlotCapacityService.get_slot_window(
+                min(reservation.start_time for reservation in candidates),
+                max(reservation.end_time for reservation in candidates)
+            )
+            slot_counts = SlotCapacityService.lock_slots(
+                db,
+                [
+                    slot_time
+                    for reservation in candidates
+                    for slot_time in SlotCapacityService.get_slot_times(
+                        *SlotCapacityService.get_slot_window(reservation.start_time, reservation.end_time)
+                    )
+                ]
+            )
+
+            window_capacities = CapacityCalendarService.get_slot_capacities(db, window_start, window_end, use_cache=False)
+            confirmed_reservations = defaultdict(list)
+
+            for reservation in db.query(
+                ReservationInfo.idx,
+                ReservationInfo.user_idx,
+                ReservationInfo.start_time,
+                ReservationInfo.end_time
+            ).filter(
+                ReservationInfo.user_idx.in_({ reservation.user_idx for reservation in candidates }),
+                ReservationInfo.state == ReservationState.confirmed,
+                ReservationInfo.start_time < window_end,
+                ReservationInfo.end_time > window_start
+            ):
+                confirmed_reservations[reservation.user_idx].append(reservation)
+
+        states = { idx: reservation.state for idx, reservation in reservations.items() }
+        slot_deltas = defaultdict(int)
+        changed_dates = set()
+        confirmed_idx_list = []
+        changed_user_idx_set = set()
         value_error_list = []
 
+        # 앞서 확정된 예약이 차지한 인원과 일정을 반영하며 순서대로 검증
         for reservation_idx in reservation_idx_list:
+            reservation = reservations.get(reservation_idx)
+
             try:
-                cls.update_reservation(
-                    db=db,
-                    reservation_idx=reservation_idx,
-                    user_type=UserType.admin,
-                    state=ReservationState.confirmed
-                )
+                if not reservation:
+                    raise ValueError("예약 정보가 존재하지 않습니다.")
+
+                if states[reservation_idx] == ReservationState.canceled:
+                    raise ValueError("삭제된 예약 정보입니다.")
+
+                if any(
+                    confirmed.idx != reservation_idx
+                    and confirmed.start_time < reservation.end_time
+                    and confirmed.end_time > reservation.start_time
+                    for confirmed in confirmed_reservations[reservation.user_idx]
+                ):
+                    raise ValueError("일정이 겹치는 예약 정보가 존재합니다.")
+
+                start_hour, end_hour = SlotCapacityService.get_slot_window(reservation.start_time, reservation.end_time)
+                covered_slot_times = set(SlotCapacityService.get_slot_times(reservation.start_time, reservation.end_time))
+                is_confirmed = states[reservation_idx] == ReservationState.confirmed
+
+                reservation_slot_counts = {
+                    slot_time: slot_counts.get(slot_time, 0) - (reservation.applicant_count if is_confirmed and slot_time in covered_slot_times else 0)
+                    for slot_time in SlotCapacityService.get_slot_times(start_hour, end_hour)
+                }
+
+                first_slot_index = (start_hour - window_start) // SlotCapacityService.slot
+
+                with Timer(capacity_check_duration_seconds, "confirm_batch"):
+                    SlotOccupancy.from_slot_counts(
+                        reservation_slot_counts,
+                        window_capacities[first_slot_index:first_slot_index + len(reservation_slot_counts)],
+                        start_hour,
+                        end_hour
+                    ).check_available(reservation.applicant_count)
             except ValueError as e:
                 value_error_list.append(
                     dict(
@@ -318,7 +683,76 @@ class ReservationService:
                         detail=str(e)
                     )
                 )
+                continue
+
+            confirmed_idx_list.append(reservation_idx)
+
+            if not is_confirmed:
+                states[reservation_idx] = ReservationState.confirmed
+                changed_user_idx_set.add(reservation.user_idx)
+                confirmed_reservations[reservation.user_idx].append(reservation)
+
+                for slot_time in covered_slot_times:
+                    slot_counts[slot_time] = slot_counts.get(slot_time, 0) + reservation.applicant_count
+                    slot_deltas[slot_time] += reservation.applicant_count
+
+        if confirmed_idx_list:
+            db.query(ReservationInfo).filter(
+                ReservationInfo.idx.in_(confirmed_idx_list)
+            ).update({ ReservationInfo.state: ReservationState.confirmed }, synchronize_session=False)
+
+            changed_dates = { slot_time.date() for slot_time, delta in slot_deltas.items() if delta }
+
+            SlotCapacityService.apply_deltas(db, slot_deltas)
+            DataVersionService.bump_dates(db, changed_dates)
+            DataVersionService.bump_users(db, changed_user_idx_set)
+            invalidation_bus.notify(db, dates=changed_dates, reservation_idx_list=confirmed_idx_list)
 
         db.commit()
 
+        for reservation_idx in confirmed_idx_list:
+            reservation = reservations[reservation_idx]
+            confirmed_interval_index.add(reservation.idx, reservation.user_idx, reservation.start_time, reservation.end_time, reservation.applicant_count)
+
+        cls.invalidate_available_reservation_times(
+            *((reservations[idx].start_time, reservations[idx].end_time) for idx in confirmed_idx_list)
+        )
+        availability_broadcaster.publish(changed_dates)
+
         return value_error_list
+
+    @classmethod
+    async def get_reservations_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.get_reservations, **kwargs)
+
+    @classmethod
+    async def get_reservations_by_cursor_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.get_reservations_by_cursor, **kwargs)
+
+    @classmethod
+    async def get_available_reservation_times_for_date_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.get_available_reservation_times_for_date, **kwargs)
+
+    @classmethod
+    async def get_available_reservation_times_for_date_range_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.get_available_reservation_times_for_date_range, **kwargs)
+
+    @classmethod
+    async def get_available_reservation_times_for_dates_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.get_available_reservation_times_for_dates, **kwargs)
+
+    @classmethod
+    async def insert_reservation_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.insert_reservation, **kwargs)
+
+    @classmethod
+    async def insert_reservations_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.insert_reservations, **kwargs)
+
+    @classmethod
+    async def update_reservation_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.update_reservation, **kwargs)
+
+    @classmethod
+    async def confirm_reservation_async(cls, db: AsyncSession, **kwargs):
+        return await db.run_sync(cls.confirm_reservation, **kwargs)
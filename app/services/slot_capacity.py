@@ -0,0 +1,219 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.reservation import ReservationInfo, ReservationState
+from app.models.slot_capacity import SlotCapacity, SlotCapacitySetting
+from app.services.data_version import DataVersionService
+from app.services.invalidation_bus import invalidation_bus
+
+
+class SlotCapacityService:
+    slot = timedelta(minutes=settings.RESERVATION_SLOT_MINUTES)
+
+    if timedelta(days=1) % slot:
+        raise ValueError("RESERVATION_SLOT_MINUTES는 1440의 약수여야 합니다.")
+
+    @classmethod
+    def floor_slot(cls, slot_time: datetime) -> datetime:
+        day_start = slot_time.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        return day_start + (slot_time - day_start) // cls.slot * cls.slot
+
+    @classmethod
+    def get_slot_window(cls, start_time: datetime, end_time: datetime):
+        start_slot = cls.floor_slot(start_time)
+        end_slot = cls.floor_slot(end_time)
+
+        if end_slot != end_time:
+            end_slot += cls.slot
+
+        return start_slot, end_slot
+
+    @classmethod
+    def get_slot_times(cls, start_time: datetime, end_time: datetime) -> List[datetime]:
+        # 예약이 시간대 전체를 포함하는 경우에만 집계 (start_time <= 시간대 시작, end_time >= 시간대 종료)
+        first_slot = cls.floor_slot(start_time)
+        last_slot = cls.floor_slot(end_time)
+
+        if first_slot != start_time:
+            first_slot += cls.slot
+
+        slot_times = []
+
+        while first_slot < last_slot:
+            slot_times.append(first_slot)
+            first_slot += cls.slot
+
+        return slot_times
+
+    @classmethod
+    def add_delta(
+        cls,
+        deltas: Dict[datetime, int],
+        start_time: datetime,
+        end_time: datetime,
+        applicant_count: int
+    ):
+        for slot_time in cls.get_slot_times(start_time, end_time):
+            deltas[slot_time] += applicant_count
+
+        return deltas
+
+    @staticmethod
+    def apply_deltas(db: Session, deltas: Dict[datetime, int]):
+        values = [
+            dict(slot_time=slot_time, applicant_count=applicant_count)
+            for slot_time, applicant_count in sorted(deltas.items()) if applicant_count
+        ]
+
+        for offset in range(0, len(values), 1000):
+            statement = insert(SlotCapacity).values(values[offset:offset + 1000])
+            statement = statement.on_conflict_do_update(
+                index_elements=[SlotCapacity.slot_time],
+                set_={
+                    "applicant_count": SlotCapacity.applicant_count + statement.excluded.applicant_count,
+                    "updated_at": datetime.now(),
+                }
+            )
+
+            db.execute(statement)
+
+    @staticmethod
+    def set_counts(db: Session, counts: Dict[datetime, int]):
+        values = [
+            dict(slot_time=slot_time, applicant_count=applicant_count)
+            for slot_time, applicant_count in sorted(counts.items()) if applicant_count
+        ]
+
+        # 재계산 결과는 기존 값에 더하지 않고 그대로 기록한다
+        for offset in range(0, len(values), 1000):
+            statement = insert(SlotCapacity).values(values[offset:offset + 1000])
+            statement = statement.on_conflict_do_update(
+                index_elements=[SlotCapacity.slot_time],
+                set_={
+                    "applicant_count": statement.excluded.applicant_count,
+                    "updated_at": datetime.now(),
+                }
+            )
+
+            db.execute(statement)
+
+    @staticmethod
+    def lock_slots(db: Session, slot_times: List[datetime]) -> Dict[datetime, int]:
+        slot_times = sorted(set(slot_times))
+
+        if not slot_times:
+            return {}
+
+        # 아직 집계 행이 없는 시간대도 잠글 수 있도록 먼저 생성한다
+        for offset in range(0, len(slot_times), 1000):
+            db.execute(
+                insert(SlotCapacity).values([
+                    dict(slot_time=slot_time, applicant_count=0) for slot_time in slot_times[offset:offset + 1000]
+                ]).on_conflict_do_nothing(
+                    index_elements=[SlotCapacity.slot_time]
+                )
+            )
+
+        # 교착 상태를 피하기 위해 항상 시간순으로 잠근다
+        slots = db.query(SlotCapacity.slot_time, SlotCapacity.applicant_count).filter(
+            SlotCapacity.slot_time.in_(slot_times)
+        ).order_by(
+            SlotCapacity.slot_time
+        ).with_for_update().all()
+
+        return { slot.slot_time: slot.applicant_count for slot in slots }
+
+    @staticmethod
+    def get_slot_counts(db: Session, start_time: datetime, end_time: datetime) -> Dict[datetime, int]:
+        slots = db.query(SlotCapacity.slot_time, SlotCapacity.applicant_count).filter(
+            SlotCapacity.slot_time >= start_time,
+            SlotCapacity.slot_time < end_time
+        ).all()
+
+        return { slot.slot_time: slot.applicant_count for slot in slots }
+
+    @classmethod
+    def compute_slot_counts(cls, db: Session) -> Dict[datetime, int]:
+        reservations = db.query(
+            ReservationInfo.start_time,
+            ReservationInfo.end_time,
+            ReservationInfo.applicant_count
+        ).filter(
+            ReservationInfo.state == ReservationState.confirmed
+        ).yield_per(10000)
+
+        slot_counts = defaultdict(int)
+
+        for reservation in reservations:
+            cls.add_delta(slot_counts, reservation.start_time, reservation.end_time, reservation.applicant_count)
+
+        return slot_counts
+
+    @staticmethod
+    def get_drift(db: Session, expected_counts: Dict[datetime, int]):
+        ledger_counts = {
+            slot.slot_time: slot.applicant_count
+            for slot in db.query(SlotCapacity.slot_time, SlotCapacity.applicant_count)
+        }
+
+        return [
+            dict(
+                slot_time=slot_time,
+                ledger_count=ledger_counts.get(slot_time, 0),
+                expected_count=expected_counts.get(slot_time, 0)
+            )
+            for slot_time in sorted(set(expected_counts) | set(ledger_counts))
+            if ledger_counts.get(slot_time, 0) != expected_counts.get(slot_time, 0)
+        ]
+
+    @classmethod
+    def verify(cls, db: Session):
+        return cls.get_drift(db, cls.compute_slot_counts(db))
+
+    @classmethod
+    def rebuild(cls, db: Session, only_if_stale: bool = False):
+        # 재계산끼리, 그리고 집계 반영(lock_slots/apply_deltas)과 동시에 실행되지 않도록 자기 자신과도 충돌하는 잠금을 사용한다
+        # 예약 변경 경로와 같은 순서(slot_capacity -> reservation_info)로 잠근다
+        db.execute(text(f"LOCK TABLE {SlotCapacity.__tablename__} IN EXCLUSIVE MODE"))
+        # 재계산 중 예약 상태가 바뀌지 않도록 쓰기를 막는다
+        db.execute(text(f"LOCK TABLE {ReservationInfo.__tablename__} IN SHARE MODE"))
+
+        # 잠금을 기다리는 동안 다른 프로세스가 먼저 재계산했을 수 있다
+        if only_if_stale and not cls.is_stale(db):
+            db.rollback()
+            return []
+
+        expected_counts = cls.compute_slot_counts(db)
+        drift = cls.get_drift(db, expected_counts)
+
+        db.query(SlotCapacity).delete(synchronize_session=False)
+        cls.set_counts(db, expected_counts)
+        db.query(SlotCapacitySetting).delete(synchronize_session=False)
+        db.add(SlotCapacitySetting(slot_minutes=settings.RESERVATION_SLOT_MINUTES))
+
+        # 집계가 바뀐 날짜는 ETag와 각 워커의 캐시가 갱신되도록 같은 트랜잭션에서 버전을 올리고 알린다
+        drifted_dates = { slot["slot_time"].date() for slot in drift }
+
+        if drifted_dates:
+            DataVersionService.bump_dates(db, drifted_dates)
+            invalidation_bus.notify(db, dates=drifted_dates)
+
+        db.commit()
+
+        return drift
+
+    @staticmethod
+    def get_slot_minutes(db: Session) -> Optional[int]:
+        return db.query(SlotCapacitySetting.slot_minutes).scalar()
+
+    @classmethod
+    def is_stale(cls, db: Session) -> bool:
+        # 집계 단위가 기록되지 않았거나 설정과 다르면 기존 집계를 사용할 수 없다
+        return cls.get_slot_minutes(db) != settings.RESERVATION_SLOT_MINUTES
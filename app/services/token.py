@@ -1,40 +1,144 @@
+import hashlib
 from datetime import datetime, timedelta
+from typing import Iterator, Optional, Tuple
 
 from fastapi import HTTPException
+from sqlalchemy import select, exists, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.models.token import TokenInfo
 from app.schemas.user import UserInfo
+from app.services.invalidation_bus import invalidation_bus
 
+token_cache = TTLCache(max_size=settings.TOKEN_CACHE_SIZE, ttl=settings.TOKEN_CACHE_TTL)
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
 
-def get_user_from_token(db: Session, token: str) -> UserInfo:
-    token_info = db.query(TokenInfo).filter(TokenInfo.token == token).first()
 
-    if not token_info or token_info.expired_at < datetime.now():
+def resolve_user_info(token_hash: str, token_info: Optional[TokenInfo], cache_generation: int) -> UserInfo:
+    now = datetime.now()
+
+    if not token_info or token_info.expired_at < now:
         raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
 
-    return UserInfo(idx=token_info.user_idx, type=token_info.user_type.value)
+    user_info = UserInfo(idx=token_info.user_idx, type=token_info.user_type.value)
+
+    # 토큰 만료 시각 이후에는 캐시에서 조회되지 않도록 유지 시간을 제한한다
+    token_cache.set(
+        token_hash,
+        user_info,
+        ttl=min(settings.TOKEN_CACHE_TTL, (token_info.expired_at - now).total_seconds()),
+        generation=cache_generation
+    )
+
+    return user_info
+
+
+def get_user_from_token(db: Session, token: str) -> UserInfo:
+    token_hash = hash_token(token)
+    user_info = token_cache.get(token_hash)
+
+    if user_info:
+        return user_info
+
+    cache_generation = token_cache.generation
+    token_info = db.query(TokenInfo).filter(TokenInfo.token_hash == token_hash).first()
+
+    return resolve_user_info(token_hash, token_info, cache_generation)
+
+
+async def get_user_from_token_async(db: AsyncSession, token: str) -> UserInfo:
+    token_hash = hash_token(token)
+    user_info = token_cache.get(token_hash)
+
+    if user_info:
+        return user_info
+
+    cache_generation = token_cache.generation
+    result = await db.execute(select(TokenInfo).where(TokenInfo.token_hash == token_hash).limit(1))
+
+    return resolve_user_info(token_hash, result.scalars().first(), cache_generation)
+
+
+def has_tokens(db: Session) -> bool:
+    return db.query(exists().select_from(TokenInfo)).scalar()
+
+
+def get_idx_ranges(db: Session, batch_size: int) -> Iterator[Tuple[int, int]]:
+    min_idx, max_idx = db.query(func.min(TokenInfo.idx), func.max(TokenInfo.idx)).one()
+
+    if min_idx is None:
+        return
+
+    for start_idx in range(min_idx, max_idx + 1, batch_size):
+        yield start_idx, start_idx + batch_size
+
+
+def invalidate_tokens(db: Session):
+    # 다른 워커와 토큰 관리 명령을 실행한 프로세스 밖의 캐시도 비운다
+    invalidation_bus.notify(db, tokens=True)
+    db.commit()
+
+    token_cache.clear()
+
+
+def extend_tokens(db: Session, expired_at: datetime, batch_size: int = settings.TOKEN_BATCH_SIZE) -> int:
+    # 테이블 전체를 한 번에 잠그지 않도록 idx 범위별로 나누어 커밋한다
+    updated_count = 0
+
+    for start_idx, end_idx in get_idx_ranges(db, batch_size):
+        updated_count += db.query(TokenInfo).filter(
+            TokenInfo.idx >= start_idx,
+            TokenInfo.idx < end_idx,
+            TokenInfo.expired_at < expired_at
+        ).update({ TokenInfo.expired_at: expired_at }, synchronize_session=False)
+        db.commit()
+
+    invalidate_tokens(db)
+
+    return updated_count
+
+
+def purge_expired_tokens(db: Session, expired_before: datetime, batch_size: int = settings.TOKEN_BATCH_SIZE) -> int:
+    deleted_count = 0
+
+    for start_idx, end_idx in get_idx_ranges(db, batch_size):
+        deleted_count += db.query(TokenInfo).filter(
+            TokenInfo.idx >= start_idx,
+            TokenInfo.idx < end_idx,
+            TokenInfo.expired_at < expired_before
+        ).delete(synchronize_session=False)
+        db.commit()
+
+    invalidate_tokens(db)
+
+    return deleted_count
 
 
 def refresh_token(db: Session):
-    now = datetime.now()
-    expired_at = now + timedelta(days=1)
-
-    tokens = db.query(TokenInfo).all()
-
-    if tokens:
-        db.query(TokenInfo).update({ TokenInfo.expired_at: expired_at }, synchronize_session=False)
-    else:
-        insert_data = [
-            TokenInfo(user_idx=1, user_type="admin", token="admin1", expired_at=expired_at),
-            TokenInfo(user_idx=2, user_type="admin", token="admin2", expired_at=expired_at),
-            TokenInfo(user_idx=3, user_type="admin", token="admin3", expired_at=expired_at),
-            TokenInfo(user_idx=1, user_type="user", token="user1", expired_at=expired_at),
-            TokenInfo(user_idx=2, user_type="user", token="user2", expired_at=expired_at),
-            TokenInfo(user_idx=3, user_type="user", token="user3", expired_at=expired_at),
-            TokenInfo(user_idx=4, user_type="user", token="user4", expired_at=expired_at),
-            TokenInfo(user_idx=5, user_type="user", token="user5", expired_at=expired_at),
-        ]
-        db.add_all(insert_data)
+    expired_at = datetime.now() + timedelta(days=1)
 
+    if has_tokens(db):
+        extend_tokens(db, expired_at)
+        return
+
+    insert_data = [
+        TokenInfo(user_idx=1, user_type="admin", token_hash=hash_token("admin1"), expired_at=expired_at),
+        TokenInfo(user_idx=2, user_type="admin", token_hash=hash_token("admin2"), expired_at=expired_at),
+        TokenInfo(user_idx=3, user_type="admin", token_hash=hash_token("admin3"), expired_at=expired_at),
+        TokenInfo(user_idx=1, user_type="user", token_hash=hash_token("user1"), expired_at=expired_at),
+        TokenInfo(user_idx=2, user_type="user", token_hash=hash_token("user2"), expired_at=expired_at),
+        TokenInfo(user_idx=3, user_type="user", token_hash=hash_token("user3"), expired_at=expired_at),
+        TokenInfo(user_idx=4, user_type="user", token_hash=hash_token("user4"), expired_at=expired_at),
+        TokenInfo(user_idx=5, user_type="user", token_hash=hash_token("user5"), expired_at=expired_at),
+    ]
+    db.add_all(insert_data)
+    invalidation_bus.notify(db, tokens=True)
     db.commit()
+
+    token_cache.clear()
@@ -0,0 +1,130 @@
+import argparse
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from app.db.session import SessionLocal
+from app.models.reservation import ReservationInfo, ReservationState
+from app.schemas.user import UserType
+from app.services.reservation import ReservationService
+from app.services.slot_capacity import SlotCapacityService
+
+BENCHMARK_USER_IDX = 1_000_000
+BENCHMARK_START_DATE = datetime(2100, 1, 1)
+BENCHMARK_END_DATE = BENCHMARK_START_DATE + timedelta(days=365)
+
+
+def create_reservations(workers: int, confirms: int, overlapping: bool):
+    db = SessionLocal()
+    try:
+        reservation_lists = []
+
+        for worker in range(workers):
+            reservations = []
+
+            for index in range(confirms):
+                if overlapping:
+                    start_time = BENCHMARK_START_DATE
+                else:
+                    start_time = BENCHMARK_START_DATE + timedelta(days=worker, hours=index % 24)
+
+                reservations.append(
+                    ReservationInfo(
+                        user_idx=BENCHMARK_USER_IDX + worker * confirms + index,
+                        start_time=start_time,
+                        end_time=start_time + timedelta(hours=1),
+                        applicant_count=1,
+                        state=ReservationState.pending,
+                    )
+                )
+
+            db.add_all(reservations)
+            db.flush()
+
+            reservation_lists.append([reservation.idx for reservation in reservations])
+
+        db.commit()
+
+        return reservation_lists
+    finally:
+        db.close()
+
+
+def confirm_reservations(reservation_idx_list):
+    db = SessionLocal()
+    try:
+        for reservation_idx in reservation_idx_list:
+            ReservationService.update_reservation(
+                db=db,
+                reservation_idx=reservation_idx,
+                user_type=UserType.admin,
+                state=ReservationState.confirmed
+            )
+    finally:
+        db.close()
+
+
+def cleanup():
+    db = SessionLocal()
+    try:
+        reservations = db.query(ReservationInfo).filter(
+            ReservationInfo.user_idx >= BENCHMARK_USER_IDX,
+            ReservationInfo.start_time >= BENCHMARK_START_DATE,
+            ReservationInfo.start_time < BENCHMARK_END_DATE
+        )
+
+        slot_deltas = defaultdict(int)
+
+        for reservation in reservations.filter(ReservationInfo.state == ReservationState.confirmed):
+            SlotCapacityService.add_delta(slot_deltas, reservation.start_time, reservation.end_time, -reservation.applicant_count)
+
+        SlotCapacityService.apply_deltas(db, slot_deltas)
+        reservations.delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def run(workers: int, confirms: int, overlapping: bool) -> float:
+    cleanup()
+
+    reservation_lists = create_reservations(workers, confirms, overlapping)
+
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(confirm_reservations, reservation_lists))
+
+    elapsed = time.perf_counter() - started_at
+
+    cleanup()
+
+    return workers * confirms / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시간대별 잠금에 따른 예약 확정 처리량 측정")
+    parser.add_argument("--workers", type=int, default=8, help="최대 동시 확정 요청 수")
+    parser.add_argument("--confirms", type=int, default=50, help="요청당 확정할 예약 수")
+    args = parser.parse_args()
+
+    worker_counts = [1]
+
+    while worker_counts[-1] * 2 <= args.workers:
+        worker_counts.append(worker_counts[-1] * 2)
+
+    print(f"{'workload':<12}{'workers':>8}{'confirms/s':>14}{'speedup':>10}")
+
+    for overlapping in (False, True):
+        baseline = None
+
+        for workers in worker_counts:
+            throughput = run(workers, args.confirms, overlapping)
+            baseline = baseline or throughput
+
+            print(f"{'overlapping' if overlapping else 'disjoint':<12}{workers:>8}{throughput:>14.1f}{throughput / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
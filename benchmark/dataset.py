@@ -0,0 +1,7 @@
+from datetime import datetime
+
+# benchmark.generate가 생성하는 데이터 범위 (실제 데이터와 겹치지 않도록 먼 미래 날짜와 큰 사용자 번호를 사용)
+GENERATED_USER_IDX = 10_000_000
+GENERATED_START_DATE = datetime(2200, 1, 1)
+USER_TOKEN_PREFIX = "bench-user-"
+ADMIN_TOKEN_PREFIX = "bench-admin-"
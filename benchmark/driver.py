@@ -0,0 +1,305 @@
+import argparse
+import http.client
+import json
+import math
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from urllib.parse import urlencode, urlsplit
+
+from benchmark.dataset import GENERATED_START_DATE, USER_TOKEN_PREFIX, ADMIN_TOKEN_PREFIX
+
+
+class RequestRenderer:
+    def __init__(self, rnd: random.Random, args):
+        self.rnd = rnd
+        self.args = args
+
+    def get_values(self):
+        day = GENERATED_START_DATE + timedelta(days=self.rnd.randrange(self.args.days))
+        start_time = day + timedelta(hours=self.rnd.randrange(24))
+
+        return dict(
+            date=day.strftime("%Y-%m-%d"),
+            week_end_date=(day + timedelta(days=6)).strftime("%Y-%m-%d"),
+            start_time=start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            end_time=(start_time + timedelta(hours=self.rnd.choice((1, 1, 2)))).strftime("%Y-%m-%d %H:%M:%S"),
+            applicant_count=self.rnd.randint(1, 100),
+            user_token=f"{USER_TOKEN_PREFIX}{self.rnd.randrange(self.args.users)}",
+            admin_token=f"{ADMIN_TOKEN_PREFIX}{self.rnd.randrange(self.args.admins)}",
+        )
+
+    def render(self, value, values):
+        # "{date}"처럼 값 전체가 치환자인 경우 원래 타입(int 등)을 유지
+        if isinstance(value, str):
+            if value.startswith("{") and value.endswith("}") and value[1:-1] in values:
+                return values[value[1:-1]]
+
+            return value.format(**values)
+
+        if isinstance(value, dict):
+            return { key: self.render(item, values) for key, item in value.items() }
+
+        if isinstance(value, list):
+            return [self.render(item, values) for item in value]
+
+        return value
+
+    def build(self, entry, target=None):
+        values = self.get_values()
+
+        if target:
+            values.update(target_user_token=target[0], target_idx=target[1])
+
+        path = self.render(entry["path"], values)
+        query = self.render(entry.get("query", {}), values)
+        headers = {}
+
+        if entry.get("token"):
+            headers["Authorization"] = f"Bearer {self.render(entry['token'], values)}"
+
+        body = None
+
+        if "body" in entry:
+            body = json.dumps(self.render(entry["body"], values))
+            headers["Content-Type"] = "application/json"
+
+        return entry["name"], entry["method"], path + (f"?{urlencode(query)}" if query else ""), headers, body
+
+
+def load_mix(path: str):
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def get_json(connection, path, token):
+    connection.request("GET", path, headers={ "Authorization": f"Bearer {token}" })
+    response = connection.getresponse()
+    body = response.read()
+
+    if response.status != 200:
+        raise RuntimeError(f"GET {path} 요청이 실패했습니다. ({response.status})")
+
+    return json.loads(body)
+
+
+def fetch_targets(base_url, rnd: random.Random, args, count: int):
+    # 수정/확정/취소 요청이 실제 변경 경로를 거치도록, 고객별 대기 예약을 조회하여 요청마다 하나씩 사용한다
+    url = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+    connection = connection_class(url.hostname, url.port, timeout=60)
+    targets = []
+
+    try:
+        # 한 고객의 예약에 변경이 몰리지 않도록 고객마다 최대 --targets-per-user건만 사용한다
+        for user_index in rnd.sample(range(args.users), args.users):
+            if len(targets) >= count:
+                break
+
+            token = f"{USER_TOKEN_PREFIX}{user_index}"
+            result = get_json(connection, f"/api/reservations?{urlencode(dict(size=args.targets_per_user))}", token)["result"]
+
+            targets.extend(
+                (token, reservation["idx"])
+                for reservation in result["reservations"] if reservation["state"] == "pending"
+            )
+    finally:
+        connection.close()
+
+    if len(targets) < count:
+        sys.exit(f"수정/확정/취소에 사용할 대기 예약이 부족합니다. (필요 {count}건, 조회 {len(targets)}건) 데이터를 다시 생성해주세요.")
+
+    rnd.shuffle(targets)
+
+    return targets[:count]
+
+
+def build_requests(mix, args):
+    # 실행마다 같은 요청 순서를 재현할 수 있도록 seed로 미리 생성한다
+    rnd = random.Random(args.seed)
+    renderer = RequestRenderer(rnd, args)
+    weights = [entry.get("weight", 1) for entry in mix]
+    entries = [rnd.choices(mix, weights)[0] for _ in range(args.warmup + args.requests)]
+
+    targets = iter(fetch_targets(args.base_url, rnd, args, sum(1 for entry in entries if entry.get("target"))))
+
+    return [renderer.build(entry, next(targets) if entry.get("target") else None) for entry in entries]
+
+
+def run_worker(base_url, requests, index_iterator, index_lock, results):
+    url = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+    connection = connection_class(url.hostname, url.port, timeout=60)
+
+    try:
+        while True:
+            with index_lock:
+                index = next(index_iterator, None)
+
+            if index is None:
+                return
+
+            name, method, path, headers, body = requests[index]
+            started_at = time.perf_counter()
+
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                status = 0
+
+            results[index] = (name, status, time.perf_counter() - started_at)
+    finally:
+        connection.close()
+
+
+def run_requests(base_url, requests, concurrency):
+    results = [None] * len(requests)
+    index_iterator = iter(range(len(requests)))
+    index_lock = threading.Lock()
+
+    workers = [
+        threading.Thread(target=run_worker, args=(base_url, requests, index_iterator, index_lock, results))
+        for _ in range(concurrency)
+    ]
+
+    started_at = time.perf_counter()
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    return results, time.perf_counter() - started_at
+
+
+def percentile(sorted_values, ratio):
+    if not sorted_values:
+        return 0.0
+
+    # nearest-rank 방식
+    return sorted_values[max(0, math.ceil(ratio * len(sorted_values)) - 1)]
+
+
+def is_error(status, expected_statuses):
+    # 연결 실패와 5xx, 요청 조합에 명시되지 않은 4xx(인증 실패, 잘못된 요청 등)는 오류로 집계한다
+    return status == 0 or status >= 500 or (400 <= status < 500 and status not in expected_statuses)
+
+
+def summarize(results, elapsed, mix):
+    expected_statuses = { entry["name"]: set(entry.get("expected_statuses", [])) for entry in mix }
+    grouped = defaultdict(list)
+
+    for name, status, latency in results:
+        error = is_error(status, expected_statuses.get(name, ()))
+        grouped[name].append((status, latency, error))
+        grouped["total"].append((status, latency, error))
+
+    summary = {}
+
+    for name, items in sorted(grouped.items()):
+        latencies = sorted(latency for _, latency, _ in items)
+        statuses = defaultdict(int)
+
+        for status, _, _ in items:
+            statuses[str(status)] += 1
+
+        summary[name] = dict(
+            requests=len(items),
+            throughput=round(len(items) / elapsed, 2),
+            errors=sum(error for _, _, error in items),
+            statuses=dict(statuses),
+            p50_ms=round(percentile(latencies, 0.50) * 1000, 3),
+            p95_ms=round(percentile(latencies, 0.95) * 1000, 3),
+            p99_ms=round(percentile(latencies, 0.99) * 1000, 3),
+        )
+
+    return summary
+
+
+def compare(summary, baseline, max_regression):
+    regressions = []
+
+    for name, result in summary.items():
+        previous = baseline.get("results", {}).get(name)
+
+        if not previous:
+            continue
+
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            if previous[key] and result[key] > previous[key] * (1 + max_regression / 100):
+                regressions.append(f"{name} {key}: {previous[key]} -> {result[key]}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청 조합(JSONL)을 재생하여 엔드포인트별 처리량과 응답 시간 측정")
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--mix", default="benchmark/mixes/default.jsonl", help="요청 조합 파일 (JSONL)")
+    parser.add_argument("--requests", type=int, default=10_000, help="측정할 요청 수")
+    parser.add_argument("--warmup", type=int, default=500, help="측정 전에 보낼 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=100_000, help="benchmark.generate로 생성한 고객 수")
+    parser.add_argument("--admins", type=int, default=10, help="benchmark.generate로 생성한 관리자 수")
+    parser.add_argument("--days", type=int, default=90, help="benchmark.generate로 생성한 날짜 수")
+    parser.add_argument("--targets-per-user", type=int, default=5, help="수정/확정/취소 대상으로 사용할 고객별 최대 대기 예약 조회 수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--max-regression", type=float, default=10, help="허용할 응답 시간 증가율(%%)")
+    args = parser.parse_args()
+
+    mix = load_mix(args.mix)
+    requests = build_requests(mix, args)
+
+    if args.warmup:
+        run_requests(args.base_url, requests[:args.warmup], args.concurrency)
+
+    results, elapsed = run_requests(args.base_url, requests[args.warmup:], args.concurrency)
+    summary = summarize(results, elapsed, mix)
+
+    print(f"{'endpoint':<28}{'requests':>10}{'req/s':>10}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+
+    for name, result in summary.items():
+        print(
+            f"{name:<28}{result['requests']:>10}{result['throughput']:>10.1f}{result['errors']:>8}"
+            f"{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+        )
+
+    report = dict(
+        config=dict(
+            mix=args.mix,
+            requests=args.requests,
+            warmup=args.warmup,
+            concurrency=args.concurrency,
+            seed=args.seed,
+        ),
+        elapsed_s=round(elapsed, 3),
+        results=summary,
+    )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(summary, json.load(file), args.max_regression)
+
+        for regression in regressions:
+            print(f"regression: {regression}")
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
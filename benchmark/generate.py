@@ -0,0 +1,185 @@
+import argparse
+import csv
+import io
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.base import engine
+from app.db.session import SessionLocal
+from app.models.reservation import ReservationInfo
+from app.models.token import TokenInfo
+from app.services.slot_capacity import SlotCapacityService
+from app.services.token import hash_token
+from benchmark.dataset import GENERATED_USER_IDX, GENERATED_START_DATE, USER_TOKEN_PREFIX, ADMIN_TOKEN_PREFIX
+
+# 시간대별 예약 비중 (업무 시간에 몰림)
+hour_weights = [1, 1, 1, 1, 1, 1, 2, 4, 8, 10, 10, 9, 6, 8, 10, 10, 9, 7, 5, 4, 3, 2, 1, 1]
+duration_weights = {1: 70, 2: 20, 3: 8, 4: 2}
+state_weights = {"pending": 60, "confirmed": 30, "canceled": 10}
+
+
+def generate_dates(rnd: random.Random, days: int, peak_days: int):
+    # 일부 날짜(시험 성수기)에 예약이 몰리도록 가중치를 부여
+    peak_dates = set(rnd.sample(range(days), min(peak_days, days)))
+
+    return [GENERATED_START_DATE + timedelta(days=day) for day in range(days)], [
+        10 if day in peak_dates else 1 for day in range(days)
+    ]
+
+
+def generate_reservations(rnd: random.Random, count: int, users: int, days: int, peak_days: int):
+    dates, date_weights = generate_dates(rnd, days, peak_days)
+    durations, duration_counts = zip(*duration_weights.items())
+    states, state_counts = zip(*state_weights.items())
+
+    slot_counts = defaultdict(int)
+    confirmed_intervals = defaultdict(list)
+    now = datetime.now()
+
+    for _ in range(count):
+        # 일부 고객이 더 많이 예약하도록 앞쪽 번호에 치우치게 선택
+        user_idx = GENERATED_USER_IDX + int(users * rnd.random() ** 2)
+        start_time = rnd.choices(dates, date_weights)[0] + timedelta(
+            hours=rnd.choices(range(24), hour_weights)[0],
+            minutes=rnd.choice((0, 0, 0, 30))
+        )
+        end_time = start_time + timedelta(hours=rnd.choices(durations, duration_counts)[0])
+        applicant_count = max(1, min(int(rnd.lognormvariate(5, 1.2)), settings.MAX_APPLICANT_COUNT))
+        state = rnd.choices(states, state_counts)[0]
+
+        if state == "confirmed":
+            # 확정 예약은 정원과 사용자별 일정 겹침 규칙을 지키도록 생성
+            slot_times = SlotCapacityService.get_slot_times(start_time, end_time)
+
+            if any(slot_counts[slot_time] + applicant_count > settings.MAX_APPLICANT_COUNT for slot_time in slot_times) or any(
+                confirmed_start < end_time and confirmed_end > start_time
+                for confirmed_start, confirmed_end in confirmed_intervals[user_idx]
+            ):
+                state = "pending"
+            else:
+                for slot_time in slot_times:
+                    slot_counts[slot_time] += applicant_count
+
+                confirmed_intervals[user_idx].append((start_time, end_time))
+
+        yield (user_idx, start_time, end_time, applicant_count, state, now, now)
+
+
+def generate_tokens(users: int, admins: int):
+    now = datetime.now()
+    expired_at = now + timedelta(days=3650)
+
+    for index in range(admins):
+        yield (GENERATED_USER_IDX + index, "admin", hash_token(f"{ADMIN_TOKEN_PREFIX}{index}"), expired_at, now, now)
+
+    for index in range(users):
+        yield (GENERATED_USER_IDX + index, "user", hash_token(f"{USER_TOKEN_PREFIX}{index}"), expired_at, now, now)
+
+
+def copy_rows(table: str, columns, rows, chunk_size: int = 100_000) -> int:
+    connection = engine.raw_connection()
+    total = 0
+
+    try:
+        cursor = connection.cursor()
+
+        while True:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            chunk = 0
+
+            for row in rows:
+                writer.writerow(row)
+                chunk += 1
+
+                if chunk >= chunk_size:
+                    break
+
+            if not chunk:
+                break
+
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+            total += chunk
+
+            print(f"{table}: {total} rows")
+
+            if chunk < chunk_size:
+                break
+
+        connection.commit()
+    finally:
+        connection.close()
+
+    return total
+
+
+def clean():
+    with engine.begin() as connection:
+        connection.execute(
+            text(f"DELETE FROM {ReservationInfo.__tablename__} WHERE user_idx >= :user_idx AND start_time >= :start_date"),
+            dict(user_idx=GENERATED_USER_IDX, start_date=GENERATED_START_DATE)
+        )
+        # 토큰은 해시로만 저장되므로 생성한 사용자 번호로 삭제한다
+        connection.execute(
+            text(f"DELETE FROM {TokenInfo.__tablename__} WHERE user_idx >= :user_idx"),
+            dict(user_idx=GENERATED_USER_IDX)
+        )
+
+
+def rebuild_slot_capacity():
+    db = SessionLocal()
+    try:
+        SlotCapacityService.rebuild(db)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 예약/토큰 데이터 생성")
+    parser.add_argument("--reservations", type=int, default=1_000_000, help="생성할 예약 수")
+    parser.add_argument("--users", type=int, default=100_000, help="생성할 고객 수 (고객별 토큰 1개)")
+    parser.add_argument("--admins", type=int, default=10, help="생성할 관리자 수")
+    parser.add_argument("--days", type=int, default=90, help=f"예약을 분포시킬 날짜 수 ({GENERATED_START_DATE:%Y-%m-%d}부터)")
+    parser.add_argument("--peak-days", type=int, default=10, help="예약이 몰리는 날짜 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--clean", action="store_true", help="이전에 생성한 데이터만 삭제")
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+
+    clean()
+
+    if args.clean:
+        rebuild_slot_capacity()
+        return
+
+    rnd = random.Random(args.seed)
+
+    copy_rows(
+        TokenInfo.__tablename__,
+        ("user_idx", "user_type", "token_hash", "expired_at", "created_at", "updated_at"),
+        generate_tokens(args.users, args.admins)
+    )
+    copy_rows(
+        ReservationInfo.__tablename__,
+        ("user_idx", "start_time", "end_time", "applicant_count", "state", "created_at", "updated_at"),
+        generate_reservations(rnd, args.reservations, args.users, args.days, args.peak_days)
+    )
+
+    rebuild_slot_capacity()
+
+    with engine.begin() as connection:
+        connection.execute(text(f"ANALYZE {ReservationInfo.__tablename__}"))
+        connection.execute(text(f"ANALYZE {TokenInfo.__tablename__}"))
+
+    print(f"done in {time.perf_counter() - started_at:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.db.base import engine
+from app.models.reservation import ReservationState
+from app.schemas.user import UserInfo, UserType
+from app.services.data_version import DataVersionService
+from app.services.interval_index import ConfirmedIntervalIndex
+from app.services.reservation import ReservationService
+from app.services.token import get_user_from_token, token_cache
+
+checked_tables = ("reservation_info", "slot_capacity", "token_info", "data_version")
+
+
+def run_service_queries(db: Session):
+    target_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=7)
+    start_time = target_date + timedelta(hours=9)
+    end_time = target_date + timedelta(hours=12)
+
+    token_cache.clear()
+    get_user_from_token(db, "admin1")
+
+    for user_type in (UserType.admin, UserType.user):
+        ReservationService.get_reservations(db=db, user_idx=1, user_type=user_type, date=target_date, size=10, page=2)
+        ReservationService.get_reservations_by_cursor(
+            db=db,
+            user_idx=1,
+            user_type=user_type,
+            size=10,
+            cursor=ReservationService.encode_cursor(start_time, 1)
+        )
+
+    ReservationService.check_user_reservation_overlap(db, 1, start_time, end_time, reservation_idx=1)
+    ReservationService.get_exist_reservation(db, 1, target_date)
+    ReservationService.get_available_reservation_times(db, start_time, end_time, reservation_idx=1)
+    DataVersionService.get_versions(db, dates=[target_date.date()], user_idx_list=[1])
+
+    # 쓰기 경로 (잠금 조회, 시간대 집계 잠금, 확정 시 일정 겹침 확인, 인덱스 갱신). main에서 롤백하므로 반영되지 않는다
+    write_start_time = start_time + timedelta(days=3650)
+    reservation = ReservationService.insert_reservation(
+        db,
+        user_info=UserInfo(idx=1, type=UserType.user.value),
+        start_time=write_start_time,
+        end_time=write_start_time + timedelta(hours=1),
+        applicant_count=1
+    )
+    ReservationService.confirm_reservation(db, reservation_idx_list=[reservation.idx], user_type=UserType.admin)
+    ReservationService.update_reservation(
+        db,
+        reservation_idx=reservation.idx,
+        user_type=UserType.admin,
+        end_time=write_start_time + timedelta(hours=2),
+        applicant_count=1,
+        state=ReservationState.confirmed
+    )
+    ConfirmedIntervalIndex.load_reservations(db, [reservation.idx])
+
+
+def find_sequential_scans(plan):
+    scans = []
+
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in checked_tables:
+        scans.append(plan["Relation Name"])
+
+    for child in plan.get("Plans", []):
+        scans += find_sequential_scans(child)
+
+    return scans
+
+
+def main():
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    failures = 0
+
+    with engine.connect() as connection:
+        # 데이터가 적은 로컬 DB에서도 인덱스를 사용할 수 있는 쿼리인지 확인하기 위해 순차 탐색을 끈다
+        connection.execute(text("SET enable_seqscan = off"))
+
+        event.listen(engine, "before_cursor_execute", record_statement)
+        try:
+            with Session(bind=connection) as db:
+                run_service_queries(db)
+        finally:
+            event.remove(engine, "before_cursor_execute", record_statement)
+
+        for statement, parameters in statements:
+            plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()[0]["Plan"]
+            scans = find_sequential_scans(plan)
+            failures += bool(scans)
+
+            print(("FAIL " + ", ".join(scans) if scans else "OK  ") + " | " + " ".join(statement.split()))
+
+        connection.rollback()
+
+    print(f"{len(statements)} queries, {failures} without index scan")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()